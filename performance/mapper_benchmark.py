@@ -0,0 +1,40 @@
+import time
+
+from polytope.datacube.transformations.datacube_mappers import DatacubeMapper
+
+
+class Test:
+    def setup_method(self):
+        self.mappers = {
+            "octahedral": DatacubeMapper(
+                "values", {"type": "octahedral", "resolution": 1280, "axes": ["latitude", "longitude"]}
+            ),
+            "healpix": DatacubeMapper(
+                "values", {"type": "healpix", "resolution": 1024, "axes": ["latitude", "longitude"]}
+            ),
+        }
+
+    def test_mapper_call_time(self):
+        num_calls = 100000
+        for grid_type, mapper in self.mappers.items():
+            lat = mapper.first_axis_vals()[1000]
+            lon = mapper.second_axis_vals(lat)[10]
+
+            time_start = time.time()
+            for _ in range(num_calls):
+                mapper._mapped_axes()
+            print(grid_type, "_mapped_axes per call", (time.time() - time_start) / num_calls)
+
+            time_start = time.time()
+            for _ in range(num_calls):
+                mapper.unmap(lat, lon)
+            print(grid_type, "unmap per call", (time.time() - time_start) / num_calls)
+
+    def test_generate_final_transformation_time(self):
+        # The cost each mapper call used to pay before the grid mapper was created once
+        num_calls = 10000
+        for grid_type, mapper in self.mappers.items():
+            time_start = time.time()
+            for _ in range(num_calls):
+                mapper.generate_final_transformation()
+            print(grid_type, "generate_final_transformation per call", (time.time() - time_start) / num_calls)
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from polytope.utility.geometry import triangulate
+
+# These are only needed to compare with ear clipping on the example shapefiles, they are not polytope dependencies
+gpd = pytest.importorskip("geopandas")
+shape = pytest.importorskip("shapely.geometry").shape
+tripy = pytest.importorskip("tripy")
+
+
+class Test:
+    def setup_method(self):
+        self.polygons = []
+        for shapefile_name in [
+            "./examples/data/World_Countries__Generalized_.shp",
+            "./examples/data/EMODnet_HA_WindFarms_pg_20220324.shp",
+        ]:
+            shapefile = gpd.read_file(shapefile_name)
+            for geometry in shapefile["geometry"]:
+                multi_polygon = shape(geometry)
+                if multi_polygon.geom_type == "Polygon":
+                    polygons = [multi_polygon]
+                else:
+                    polygons = list(multi_polygon.geoms)
+                for polygon in polygons:
+                    xx, yy = polygon.exterior.coords.xy
+                    self.polygons.append([list(a) for a in zip(xx, yy)])
+
+    def test_triangulation_time(self):
+        time_start = time.time()
+        num_triangles = sum(len(triangulate(points)) for points in self.polygons)
+        print("sweep line triangulation", num_triangles, time.time() - time_start)
+
+        time_start = time.time()
+        num_triangles = sum(len(tripy.earclip(points)) for points in self.polygons)
+        print("tripy ear clipping", num_triangles, time.time() - time_start)
+
+    def test_largest_polygon_triangulation_time(self):
+        points = max(self.polygons, key=len)
+        print(len(points))
+
+        time_start = time.time()
+        triangulate(points)
+        print("sweep line triangulation", time.time() - time_start)
+
+        time_start = time.time()
+        tripy.earclip(points)
+        print("tripy ear clipping", time.time() - time_start)
@@ -50,23 +50,23 @@ class FDBDatacube(Datacube):
                 self._check_and_add_axes(options, name, val)
 
     def get(self, requests: IndexTree):
-        for r in requests.leaves:
-            path = r.flatten()
-            path = self.remap_path(path)
-            if len(path.items()) == self.axis_counter:
-                # first, find the grid mapper transform
-                unmapped_path = {}
-                path_copy = deepcopy(path)
-                for key in path_copy:
-                    axis = self._axes[key]
-                    (path, unmapped_path) = axis.unmap_total_path_to_datacube(path, unmapped_path)
-                path = self.fit_path(path)
-                subxarray = glue(path, unmapped_path)
-                key = list(subxarray.keys())[0]
-                value = subxarray[key]
-                r.result = (key, value)
-            else:
-                r.remove_branch()
+        for chunk in requests.chunked_leaves_with_paths(self.leaf_chunk_size):
+            for r, path in chunk:
+                path = self.remap_path(path)
+                if len(path.items()) == self.axis_counter:
+                    # first, find the grid mapper transform
+                    unmapped_path = {}
+                    path_copy = deepcopy(path)
+                    for key in path_copy:
+                        axis = self._axes[key]
+                        (path, unmapped_path) = axis.unmap_total_path_to_datacube(path, unmapped_path)
+                    path = self.fit_path(path)
+                    subxarray = glue(path, unmapped_path)
+                    key = list(subxarray.keys())[0]
+                    value = subxarray[key]
+                    r.result = (key, value)
+                else:
+                    r.remove_branch()
 
     def datacube_natural_indexes(self, axis, subarray):
         indexes = subarray[axis.name]
@@ -75,6 +75,12 @@ class FDBDatacube(Datacube):
     def select(self, path, unmapped_path):
         return self.dataarray
 
+    def fixed_indexes(self, axis):
+        # The values of the FDB axes do not depend on the rest of the request
+        if len(axis.transformations) == 0 and axis.name in self.dataarray:
+            return self.dataarray[axis.name]
+        return None
+
     def ax_vals(self, name):
         for _name, values in self.dataarray.items():
             if _name == name:
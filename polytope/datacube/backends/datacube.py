@@ -15,6 +15,11 @@ from ..transformations.datacube_transformations import (
 
 
 class Datacube(ABC):
+    # Number of leaves of the request tree handled at a time by get
+    leaf_chunk_size = 10000
+    # Number of indexes of sub-datacubes kept by find_axis_indexes
+    index_cache_size = 100000
+
     @abstractmethod
     def get(self, requests: IndexTree) -> Any:
         """Return data given a set of request trees"""
@@ -76,7 +81,7 @@ class Datacube(ABC):
     def has_index(self, path: DatacubePath, axis, index):
         "Given a path to a subset of the datacube, checks if the index exists on that sub-datacube axis"
         path = self.fit_path(path)
-        indexes = axis.find_indexes(path, self)
+        indexes = self.find_axis_indexes(path, axis)
         return index in indexes
 
     def fit_path(self, path):
@@ -93,7 +98,7 @@ class Datacube(ABC):
         e.g. returns integer discrete points between two floats
         """
         path = self.fit_path(path)
-        indexes = axis.find_indexes(path, self)
+        indexes = self.find_axis_indexes(path, axis)
         search_ranges = axis.remap([lower, upper])
         original_search_ranges = axis.to_intervals([lower, upper])
         # Find the offsets for each interval in the requested range, which we will need later
@@ -108,6 +113,39 @@ class Datacube(ABC):
             idx_between = unique(idx_between)
         return idx_between
 
+    def find_axis_indexes(self, path: DatacubePath, axis):
+        """
+        Return the indexes of an axis on the sub-datacube at a fitted path. The indexes of each path are only looked
+        up once, and those of the axes whose indexes do not depend on the path are not looked up at all.
+        """
+        indexes = self.fixed_indexes(axis)
+        if indexes is not None:
+            return indexes
+        # The cache is created on first use, so that the datacubes do not need to create it themselves
+        cache = getattr(self, "_index_cache", None)
+        if cache is None:
+            cache = self._index_cache = {}
+        key = (axis.name, tuple(path.items()))
+        indexes = cache.get(key)
+        if indexes is None:
+            if len(cache) >= self.index_cache_size:
+                cache.clear()
+            # Looking up the indexes can modify the path, which is part of the key
+            indexes = axis.find_indexes(DatacubePath(path), self)
+            cache[key] = indexes
+        return indexes
+
+    def fixed_indexes(self, axis):
+        """Return the indexes of an axis if they are the same on every sub-datacube, or None otherwise"""
+        return None
+
+    def get_indices_and_positions(self, path: DatacubePath, axis, lower, upper, method=None):
+        """
+        Return the indexes between lower and upper like get_indices, together with their positions in the data of the
+        datacube, or None if the positions of the indexes are not known
+        """
+        return self.get_indices(path, axis, lower, upper, method), None
+
     def _look_up_datacube(self, search_ranges, search_ranges_offset, indexes, axis, method):
         idx_between = []
         for i in range(len(search_ranges)):
@@ -120,17 +158,15 @@ class Datacube(ABC):
             # values before returning them
             for j in range(len(indexes_between)):
                 # if we have a special indexes between range that needs additional offset, treat it here
-                if len(indexes_between[j]) == 0:
-                    idx_between = idx_between
-                else:
-                    for k in range(len(indexes_between[j])):
-                        if offset is None:
-                            indexes_between[j][k] = indexes_between[j][k]
-                        else:
-                            indexes_between[j][k] = round(indexes_between[j][k] + offset, int(-math.log10(axis.tol)))
-                        idx_between.append(indexes_between[j][k])
+                idx_between.extend(self._offset_indexes(indexes_between[j], offset, axis))
         return idx_between
 
+    def _offset_indexes(self, indexes, offset, axis):
+        # Move the indexes found on the cyclic range back to the requested range
+        if offset is None:
+            return indexes
+        return [round(index + offset, int(-math.log10(axis.tol))) for index in indexes]
+
     def get_mapper(self, axis):
         """
         Get the type mapper for a subaxis of the datacube given by label
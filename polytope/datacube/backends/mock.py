@@ -27,8 +27,8 @@ class MockDatacube(Datacube):
         # Takes in a datacube and verifies the leaves of the tree are complete
         # (ie it found values for all datacube axis)
 
-        for r in requests.leaves:
-            path = r.flatten()
+        # The results are computed leaf by leaf, so the leaves are not collected in chunks
+        for r, path in requests.leaves_with_paths():
             if len(path.items()) == len(self.dimensions.items()):
                 result = 0
                 for k, v in path.items():
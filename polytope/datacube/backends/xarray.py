@@ -1,7 +1,8 @@
-from copy import deepcopy
 
+import numpy as np
 import xarray as xr
 
+from ..transformations.datacube_mappers import DatacubeMapper
 from .datacube import Datacube, IndexTree
 
 
@@ -46,24 +47,118 @@ class XArrayDatacube(Datacube):
                 self._check_and_add_axes(options, name, val)
 
     def get(self, requests: IndexTree):
-        for r in requests.leaves:
-            path = r.flatten()
-            path = self.remap_path(path)
-            if len(path.items()) == self.axis_counter:
-                # first, find the grid mapper transform
-                unmapped_path = {}
-                path_copy = deepcopy(path)
-                for key in path_copy:
-                    axis = self._axes[key]
-                    (path, unmapped_path) = axis.unmap_total_path_to_datacube(path, unmapped_path)
-                path = self.fit_path(path)
-                subxarray = self.dataarray.sel(path, method="nearest")
-                subxarray = subxarray.sel(unmapped_path)
-                value = subxarray.item()
-                key = subxarray.name
-                r.result = (key, value)
+        grid_mapper = self._bulk_grid_mapper()
+        for chunk in requests.chunked_leaves_with_paths(self.leaf_chunk_size):
+            leaves = []
+            points = []
+            grid_points = []
+            for r, path in chunk:
+                path = self.remap_path(path)
+                if len(path.items()) == self.axis_counter:
+                    # first, find the grid mapper transform
+                    unmapped_path = {}
+                    if grid_mapper is not None:
+                        # The values on the axes of the grid mapper are unmapped for the whole chunk at once below
+                        first_axis, second_axis = grid_mapper._mapped_axes()
+                        grid_points.append((path.pop(first_axis), path.pop(second_axis)))
+                    for key in path.keys():
+                        axis = self._axes[key]
+                        (path, unmapped_path) = axis.unmap_total_path_to_datacube(path, unmapped_path)
+                    path = self.fit_path(path)
+                    leaves.append(r)
+                    points.append((path, unmapped_path))
+                else:
+                    r.remove_branch()
+            if len(leaves) > 0:
+                if grid_mapper is not None:
+                    first_vals, second_vals = zip(*grid_points)
+                    grid_idxs = grid_mapper.unmap_many(first_vals, second_vals).tolist()
+                    for (_, unmapped_path), grid_idx in zip(points, grid_idxs):
+                        unmapped_path[grid_mapper.old_axis] = grid_idx
+                # The slicer recorded the positions of the values of the axes without transformations
+                positions = [_node_positions(r) for r in leaves]
+                for r, value in zip(leaves, self.select_points(points, positions)):
+                    r.result = (self.dataarray.name, value)
+
+    def _bulk_grid_mapper(self):
+        # The grid mapper whose axes can be unmapped in bulk, which needs them to have no other transformation
+        grid_mappers = []
+        for axis in self._axes.values():
+            for transformation in axis.transformations:
+                if isinstance(transformation, DatacubeMapper) and transformation not in grid_mappers:
+                    grid_mappers.append(transformation)
+        if len(grid_mappers) != 1:
+            return None
+        mapped_axes = [self._axes[name] for name in grid_mappers[0]._mapped_axes()]
+        if any(axis.is_cyclic or axis.has_merger or axis.reorder or axis.type_change for axis in mapped_axes):
+            return None
+        return grid_mappers[0]
+
+    def fixed_indexes(self, axis):
+        # The indexes of an axis without transformations are the coordinates of its dimension
+        if axis.name in self.complete_axes and len(axis.transformations) == 0 and axis.name in self.dataarray.indexes:
+            return self.dataarray.indexes[axis.name]
+        return None
+
+    def get_indices(self, path, axis, lower, upper, method=None):
+        return self.get_indices_and_positions(path, axis, lower, upper, method)[0]
+
+    def get_indices_and_positions(self, path, axis, lower, upper, method=None):
+        indexes = self.fixed_indexes(axis)
+        if indexes is None:
+            return super().get_indices(path, axis, lower, upper, method), None
+        # The search for the indexes between lower and upper also finds their positions along the dimension
+        start, end = axis.find_positions_between(indexes, lower, upper, method)
+        values = self._offset_indexes(indexes[start:end].to_list(), axis.offset([lower, upper]), axis)
+        return values, list(range(start, end))
+
+    def select_points(self, points, known_positions=None):
+        """
+        Return the values of the datacube at a list of points, each given by a path selecting the nearest index and
+        an unmapped path selecting the exact index, with one vectorized indexing call for all the points.
+        The positions of the points along some of the dimensions can be given, so they do not need to be looked up.
+        """
+        positions = self._point_positions(points, known_positions)
+        if positions is not None:
+            subarray = self.dataarray.isel({dim: xr.Variable("points", pos) for dim, pos in positions.items()})
+            subarray = subarray.transpose("points", ...)
+            if subarray.size == len(points):
+                return subarray.values.reshape(len(points)).tolist()
+        # Points which cannot be read together are read one by one, which raises the same errors as a selection
+        return [self.select(path, unmapped_path).item() for path, unmapped_path in points]
+
+    def _point_positions(self, points, known_positions=None):
+        keys = points[0][0].keys() | points[0][1].keys()
+        if any(path.keys() | unmapped_path.keys() != keys for path, unmapped_path in points):
+            return None
+        positions = {}
+        for key in keys:
+            if key not in self.dataarray.dims:
+                return None
+            if known_positions is not None and all(key in point_positions for point_positions in known_positions):
+                positions[key] = np.array([point_positions[key] for point_positions in known_positions])
+                continue
+            index = self.dataarray.indexes.get(key)
+            if key in points[0][0]:
+                labels = [path[key] for path, _ in points]
+                if index is None:
+                    return None
+                # Most labels are exact matches, which do not need the distance to their neighbours to be found
+                pos = index.get_indexer(labels)
+                missing = np.nonzero(pos < 0)[0]
+                if len(missing) > 0:
+                    pos[missing] = index.get_indexer([labels[i] for i in missing], method="nearest")
             else:
-                r.remove_branch()
+                labels = [unmapped_path[key] for _, unmapped_path in points]
+                if index is None:
+                    # Like in a selection, the labels of a dimension without coordinates are its positions
+                    pos = np.asarray(labels, dtype=np.int64)
+                else:
+                    pos = index.get_indexer(labels)
+            if np.any(pos < 0):
+                return None
+            positions[key] = pos
+        return positions
 
     def datacube_natural_indexes(self, axis, subarray):
         if axis.name in self.complete_axes:
@@ -90,3 +185,12 @@ class XArrayDatacube(Datacube):
             if _name not in treated_axes:
                 if _name == name:
                     return self.dataarray[name].values[0]
+
+
+def _node_positions(node):
+    positions = {}
+    while node.parent is not None:
+        if node.position is not None:
+            positions[node.axis.name] = node.position
+        node = node.parent
+    return positions
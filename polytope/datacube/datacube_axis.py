@@ -591,21 +591,9 @@ class DatacubeAxis(ABC):
         indexes_between_ranges = []
         for indexes in index_ranges:
             if self.name in datacube.complete_axes:
-                # Find the range of indexes between lower and upper
-                # https://pandas.pydata.org/docs/reference/api/pandas.Index.searchsorted.html
-                # Assumes the indexes are already sorted (could sort to be sure) and monotonically increasing
-                if method == "surrounding":
-                    start = indexes.searchsorted(low, "left")
-                    end = indexes.searchsorted(up, "right")
-                    start = max(start - 1, 0)
-                    end = min(end + 1, len(indexes))
-                    indexes_between = indexes[start:end].to_list()
-                    indexes_between_ranges.append(indexes_between)
-                else:
-                    start = indexes.searchsorted(low, "left")
-                    end = indexes.searchsorted(up, "right")
-                    indexes_between = indexes[start:end].to_list()
-                    indexes_between_ranges.append(indexes_between)
+                start, end = self.find_positions_between(indexes, low, up, method)
+                indexes_between = indexes[start:end].to_list()
+                indexes_between_ranges.append(indexes_between)
             else:
                 if method == "surrounding":
                     start = indexes.index(low)
@@ -619,6 +607,17 @@ class DatacubeAxis(ABC):
                     indexes_between_ranges.append(indexes_between)
         return indexes_between_ranges
 
+    def find_positions_between(self, indexes, low, up, method=None):
+        # Find the range of positions of the indexes between lower and upper
+        # https://pandas.pydata.org/docs/reference/api/pandas.Index.searchsorted.html
+        # Assumes the indexes are already sorted (could sort to be sure) and monotonically increasing
+        start = indexes.searchsorted(low, "left")
+        end = indexes.searchsorted(up, "right")
+        if method == "surrounding":
+            start = max(start - 1, 0)
+            end = min(end + 1, len(indexes))
+        return start, end
+
     @staticmethod
     def create_standard(name, values, datacube):
         values = np.array(values)
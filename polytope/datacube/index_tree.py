@@ -1,9 +1,21 @@
+import gc
 import json
+import math
+from array import array
+from copy import deepcopy
+from numbers import Real
 from typing import OrderedDict
 
+import numpy as np
+import pandas as pd
+import xarray as xr
 from sortedcontainers import SortedList
 
-from .datacube_axis import IntDatacubeAxis
+from .datacube_axis import (
+    IntDatacubeAxis,
+    UnsliceableDatacubeAxis,
+    _type_to_axis_lookup,
+)
 
 
 class DatacubePath(OrderedDict):
@@ -20,28 +32,108 @@ class DatacubePath(OrderedDict):
         print(result[:-1])
 
 
+class _SortedChildren(SortedList):
+    # Read-only sorted view of the children of a node, which are changed through the IndexTree methods instead
+    def _read_only(self, *args):
+        raise TypeError("The children of an IndexTree can only be changed with its add_child and remove_branch methods")
+
+    add = update = remove = discard = pop = clear = _read_only
+
+
 class IndexTree(object):
+    # Most nodes of a request tree are leaves, so the nodes have no __dict__ and only allocate a children index once
+    # they have children
+    __slots__ = (
+        "value",
+        "_children",
+        "_sorted_children",
+        "_in_order",
+        "_parent",
+        "result",
+        "axis",
+        "position",
+    )
+
     root = IntDatacubeAxis()
     root.name = "root"
+    no_children = _SortedChildren()
 
     def __init__(self, axis=root, value=None):
         self.value = value
-        self.children = SortedList()
+        # The children are indexed by their key. They are usually added in order, and are only sorted when they were
+        # not and they are iterated over
+        self._children = None
+        self._sorted_children = None
+        self._in_order = True
         self._parent = None
         self.result = None
         self.axis = axis
+        # Position of the value along the axis in the data of the datacube, if the slicer knows it
+        self.position = None
+
+    @property
+    def children(self):
+        if not self._children:
+            return IndexTree.no_children
+        if self._sorted_children is None:
+            self._sorted_children = _SortedChildren(self._child_nodes())
+        return self._sorted_children
+
+    def _ordered_children(self):
+        # The children added in order are visited in the order of the index, without building a sorted list
+        if self._in_order:
+            return self._children.values()
+        return self.children
+
+    def _child_nodes(self):
+        for child in self._children.values():
+            if isinstance(child, list):
+                yield from child
+            else:
+                yield child
+
+    def _key(self):
+        # Values within twice the tolerance of the axis are equal, so numeric values are indexed by their bucket of
+        # that width and an equal child is always in the same or a neighbouring bucket
+        value = self.value
+        if type(value) in (float, int) or (isinstance(value, Real) and not isinstance(value, bool)):
+            tol = self.axis.tol
+            if tol > 0:
+                return (self.axis.name, math.floor(value / (2 * tol)), True)
+        return (self.axis.name, value, False)
 
     @property
     def leaves(self):
-        leaves = []
-        self._collect_leaf_nodes(leaves)
-        return leaves
+        return list(self.iter_leaves())
+
+    def iter_leaves(self):
+        """Iterate over the leaves in order, without recursion and without collecting them first"""
+        stack = [self]
+        while len(stack) > 0:
+            node = stack.pop()
+            if not node._children:
+                yield node
+            else:
+                stack.extend(reversed(node._ordered_children()))
+
+    def leaves_with_paths(self):
+        """Iterate over the leaves in order, together with their path, in a single traversal of the tree"""
+        entries = [] if self.axis == IndexTree.root else list(self.flatten().items())[:-1]
+        stack = [(self, len(entries))]
+        while len(stack) > 0:
+            node, depth = stack.pop()
+            # The path of a node extends the path of its parent, which was the last node visited at that depth
+            del entries[depth:]
+            if node.axis != IndexTree.root:
+                entries.append((node.axis.name, node.value))
+            if not node._children:
+                yield node, DatacubePath(entries)
+            else:
+                stack.extend((child, len(entries)) for child in reversed(node._ordered_children()))
 
-    def _collect_leaf_nodes(self, leaves):
-        if len(self.children) == 0:
-            leaves.append(self)
-        for n in self.children:
-            n._collect_leaf_nodes(leaves)
+    def chunked_leaves_with_paths(self, chunk_size):
+        """Iterate over the leaves with their paths in lists of at most chunk_size leaves"""
+        return _chunks(self.leaves_with_paths(), chunk_size)
 
     def __setitem__(self, key, value):
         setattr(self, key, value)
@@ -81,9 +173,33 @@ class IndexTree(object):
             return f"{self.axis}"
 
     def add_child(self, node):
-        self.children.add(node)
+        if self._children is None:
+            self._children = {}
+        key = node._key()
+        existing = self._children.get(key)
+        if existing is None:
+            if self._in_order and self._children:
+                self._in_order = next(reversed(self._children.values())) < node
+            self._children[key] = node
+        elif isinstance(existing, list):
+            existing.append(node)
+        else:
+            # Only happens when adding equal children without create_child
+            self._children[key] = [existing, node]
+            self._in_order = False
+        self._sorted_children = None
         node._parent = self
 
+    def _remove_child(self, node):
+        key = node._key()
+        existing = self._children[key]
+        if isinstance(existing, list):
+            existing = [child for child in existing if child is not node]
+            self._children[key] = existing[0] if len(existing) == 1 else existing
+        else:
+            del self._children[key]
+        self._sorted_children = None
+
     def create_child_not_safe(self, axis, value):
         node = IndexTree(axis, value)
         self.add_child(node)
@@ -104,9 +220,8 @@ class IndexTree(object):
     @parent.setter
     def set_parent(self, node):
         if self.parent is not None:
-            self.parent.children.remove(self)
-        self._parent = node
-        self._parent.children.add(self)
+            self.parent._remove_child(self)
+        node.add_child(self)
 
     def get_root(self):
         node = self
@@ -118,16 +233,21 @@ class IndexTree(object):
         return self.parent is None
 
     def find_child(self, node):
-        index = self.children.bisect_left(node)
-        if index >= len(self.children):
-            return None
-        child = self.children[index]
-        if not child == node:
+        if not self._children:
             return None
-        return child
+        axis_name, bucket, quantized = node._key()
+        buckets = (bucket, bucket - 1, bucket + 1) if quantized else (bucket,)
+        for b in buckets:
+            child = self._children.get((axis_name, b, quantized))
+            for candidate in child if isinstance(child, list) else [child]:
+                if candidate is not None and candidate == node:
+                    return candidate
+        return None
 
     def merge(self, other):
-        for other_child in other.children:
+        if not other._children:
+            return
+        for other_child in list(other._child_nodes()):
             my_child = self.find_child(other_child)
             if not my_child:
                 self.add_child(other_child)
@@ -152,9 +272,9 @@ class IndexTree(object):
     def remove_branch(self):
         if not self.is_root():
             old_parent = self._parent
-            self._parent.children.remove(self)
+            self._parent._remove_child(self)
             self._parent = None
-            if len(old_parent.children) == 0:
+            if not old_parent._children:
                 old_parent.remove_branch()
 
     def flatten(self):
@@ -192,3 +312,511 @@ class IndexTree(object):
     def to_json(self):
         dico = self.to_dict()
         return json.dumps(dico, default=str)
+
+    def to_npz(self, file, compressed=False):
+        """
+        Save the tree below this node in the NumPy .npz format, as one array of values per axis and the structure of
+        the tree as the axis and the number of children of each node, in breadth-first order.
+        """
+        nodes = [self]
+        child_counts = []
+        results = []
+        i = 0
+        while i < len(nodes):
+            node = nodes[i]
+            if node._children:
+                children = node._ordered_children()
+                child_counts.append(len(children))
+                nodes.extend(children)
+            else:
+                child_counts.append(0)
+            if node.result is not None:
+                results.append(node.result)
+            i += 1
+        has_result = np.fromiter((node.result is not None for node in nodes), dtype=bool, count=len(nodes))
+        axis_codes = {}
+        node_axes = []
+        axis_values = []
+        for node in nodes[1:]:
+            code = axis_codes.get(node.axis.name)
+            if code is None:
+                code = axis_codes[node.axis.name] = len(axis_values)
+                axis_values.append([])
+            node_axes.append(code)
+            axis_values[code].append(node.value)
+        arrays = {f"values_{code}": _to_typed_array(values) for code, values in enumerate(axis_values)}
+        if results and all(isinstance(result, tuple) and len(result) == 2 for result in results):
+            # The (key, value) results of the xarray and FDB datacubes are saved as two typed arrays instead of pickled
+            names, results = zip(*results)
+            arrays["result_names"] = _to_typed_array(names)
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            file,
+            axis_names=np.array(list(axis_codes), dtype=str),
+            node_axes=_to_index_array(node_axes),
+            child_counts=_to_index_array(child_counts),
+            has_result=has_result,
+            results=_to_typed_array(results),
+            **arrays,
+        )
+
+    @staticmethod
+    def from_npz(file, axes=None, allow_pickle=False):
+        """
+        Load a tree saved with to_npz. The nodes are on the given axes, or on standard axes for the type of their
+        values. Values and results which are not numbers, timestamps, timedeltas, strings or (key, value) pairs of
+        those are pickled in the file and only loaded with allow_pickle.
+        """
+        with np.load(file, allow_pickle=allow_pickle) as data:
+            axis_names = data["axis_names"].tolist()
+            node_axes = data["node_axes"].tolist()
+            child_counts = data["child_counts"].tolist()
+            result_nodes = np.nonzero(data["has_result"])[0].tolist()
+            results = _from_npz_array(data["results"])
+            if "result_names" in data:
+                results = list(zip(_from_npz_array(data["result_names"]), results))
+            tree_axes = []
+            axis_values = []
+            for code, name in enumerate(axis_names):
+                values = data[f"values_{code}"]
+                if axes is not None and name in axes:
+                    axis = axes[name]
+                else:
+                    axis = deepcopy(_type_to_axis_lookup.get(values.dtype.type, UnsliceableDatacubeAxis()))
+                    axis.name = name
+                tree_axes.append(axis)
+                axis_values.append(iter(_from_npz_array(values)))
+        nodes = [IndexTree()]
+        # None of the new nodes can be garbage yet, so the cyclic garbage collector repeatedly going through the
+        # growing tree only slows the loading down
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for i, count in enumerate(child_counts):
+                parent = nodes[i]
+                for _ in range(count):
+                    code = node_axes[len(nodes) - 1]
+                    child = IndexTree(tree_axes[code], next(axis_values[code]))
+                    parent.add_child(child)
+                    nodes.append(child)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        for i, result in zip(result_nodes, results):
+            nodes[i].result = result
+        return nodes[0]
+
+    def to_arrays(self):
+        """Return the coordinates of the leaves, as one array per axis, and an array of the values of their results"""
+        coords, results = _leaf_arrays(self.leaves_with_paths())
+        return coords, _result_values(results)[1]
+
+    def to_xarray(self):
+        """Return the results of the leaves as an xarray Dataset along a points dimension, with the leaf coordinates"""
+        return _to_dataset(*_leaf_arrays(self.leaves_with_paths()))
+
+
+class ColumnarIndexTree(object):
+    """
+    Request tree stored level by level, with the values of all the nodes of a level in one array and the children of
+    each node as a contiguous range of the next level.
+    The nodes are accessed through ColumnarIndexTreeNode handles, which have the interface of the IndexTree nodes
+    used by the slicer and the datacubes.
+    """
+
+    def __init__(self):
+        # All the nodes of a level are on the same axis, and the root is the only node of level 0
+        # While the tree is built, the nodes are appended to their level, with the unknown positions stored as -1, and
+        # the children equal to each other are only merged when the tree is compacted
+        self.axes = [IndexTree.root]
+        self.values = [[None]]
+        self.parents = [array("q", [-1])]
+        self.positions = [array("q", [-1])]
+        self.child_offsets = None
+        self.results = [None]
+        self.removed = [None]
+
+    @property
+    def root(self):
+        return ColumnarIndexTreeNode(self, 0, 0)
+
+    @property
+    def leaves(self):
+        return self.root.leaves
+
+    def iter_leaves(self):
+        return self.root.iter_leaves()
+
+    def leaves_with_paths(self):
+        return self.root.leaves_with_paths()
+
+    def chunked_leaves_with_paths(self, chunk_size):
+        return self.root.chunked_leaves_with_paths(chunk_size)
+
+    def create_child(self, axis, value):
+        return self.root.create_child(axis, value)
+
+    def to_arrays(self):
+        """Return the coordinates of the leaves, as one array per axis, and an array of the values of their results"""
+        coords, results = self._leaf_arrays()
+        return coords, _result_values(results)[1]
+
+    def to_xarray(self):
+        """Return the results of the leaves as an xarray Dataset along a points dimension, with the leaf coordinates"""
+        return _to_dataset(*self._leaf_arrays())
+
+    def _leaf_arrays(self):
+        self.compact()
+        last = len(self.axes) - 1
+        alive = [np.ones(1, dtype=bool)]
+        for level in range(1, last + 1):
+            level_alive = alive[-1][self.parents[level]]
+            if self.removed[level] is not None:
+                level_alive &= ~self.removed[level]
+            alive.append(level_alive)
+        for level in range(last):
+            alive_children = np.bincount(self.parents[level + 1][alive[level + 1]], minlength=len(alive[level]))
+            if np.any(alive[level] & (alive_children == 0)):
+                # Leaves above the last level are interleaved with the others, so we walk the tree instead
+                return _leaf_arrays(self.leaves_with_paths())
+        # The nodes of each level are sorted by parent and value, so the leaves on the last level are already in order
+        leaves = np.nonzero(alive[last])[0]
+        coords = {}
+        index = leaves
+        for level in range(last, 0, -1):
+            values = self.values[level][index]
+            coords[self.axes[level].name] = _to_typed_array(values.tolist()) if values.dtype == object else values
+            index = self.parents[level][index]
+        coords = dict(reversed(coords.items()))
+        if self.results[last] is None:
+            return coords, [None] * len(leaves)
+        return coords, self.results[last][leaves].tolist()
+
+    def compact(self):
+        """
+        Convert the levels to arrays, with the children of each node sorted by value and the children equal within the
+        tolerance of their axis merged into one
+        """
+        if self.child_offsets is not None:
+            return self
+        self.values[0] = np.array(self.values[0], dtype=object)
+        self.parents[0] = np.array(self.parents[0], dtype=np.int64)
+        self.positions[0] = np.array(self.positions[0], dtype=np.int64)
+        for level in range(1, len(self.axes)):
+            values = _to_array(self.values[level])
+            parents = np.asarray(self.parents[level], dtype=np.int64)
+            order = _sort_order(parents, values)
+            sorted_values = values[order]
+            sorted_parents = parents[order]
+            # The sort keeps equal children next to each other, so each of them starts a new node only if it differs
+            # from the one before it
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = (sorted_parents[1:] != sorted_parents[:-1]) | ~_equal_values(
+                sorted_values[1:], sorted_values[:-1], self.axes[level].tol
+            )
+            starts = np.nonzero(first)[0]
+            positions = np.asarray(self.positions[level], dtype=np.int64)
+            if len(starts) < len(order):
+                # Like in an IndexTree, the merged node keeps the value of the child created first
+                kept = np.minimum.reduceat(order, starts)
+                self.positions[level] = np.maximum.reduceat(positions[order], starts)
+            else:
+                kept = order
+                self.positions[level] = positions[order]
+            self.values[level] = values[kept]
+            self.parents[level] = parents[kept]
+            if level + 1 < len(self.axes):
+                # The nodes of this level moved or were merged, so we need to update the parents of the next level
+                new_index = np.empty(len(order), dtype=np.int64)
+                new_index[order] = np.cumsum(first) - 1
+                self.parents[level + 1] = new_index[np.asarray(self.parents[level + 1], dtype=np.int64)]
+        self.child_offsets = []
+        for level in range(len(self.axes)):
+            if level + 1 < len(self.axes):
+                nodes = np.arange(len(self.values[level]) + 1)
+                self.child_offsets.append(np.searchsorted(self.parents[level + 1], nodes))
+            else:
+                self.child_offsets.append(np.zeros(len(self.values[level]) + 1, dtype=np.int64))
+        return self
+
+    def to_index_tree(self):
+        """Convert to an IndexTree, keeping the results and leaving out the removed branches"""
+        self.compact()
+        tree = IndexTree()
+        self._add_index_tree_children(tree, 0, 0)
+        return tree
+
+    def _add_index_tree_children(self, node, level, index):
+        for child in self._child_indexes(level, index):
+            child_node = IndexTree(self.axes[level + 1], self._value(level + 1, child))
+            child_node.result = self._result(level + 1, child)
+            child_node.position = self._position(level + 1, child)
+            node.add_child(child_node)
+            self._add_index_tree_children(child_node, level + 1, child)
+
+    def _create_child(self, level, index, axis, value):
+        if self.child_offsets is not None:
+            raise ValueError("Cannot add children to a compacted request tree")
+        level += 1
+        if level == len(self.axes):
+            self.axes.append(axis)
+            self.values.append([])
+            self.parents.append(array("q"))
+            self.positions.append(array("q"))
+            self.results.append(None)
+            self.removed.append(None)
+        elif self.axes[level].name != axis.name:
+            raise ValueError(f"Cannot add a child on axis {axis.name} to the level of axis {self.axes[level].name}")
+        self.values[level].append(value)
+        self.parents[level].append(index)
+        self.positions[level].append(-1)
+        return len(self.values[level]) - 1
+
+    def _child_indexes(self, level, index):
+        self.compact()
+        start, end = self.child_offsets[level][index], self.child_offsets[level][index + 1]
+        if start == end or self.removed[level + 1] is None:
+            return range(start, end)
+        return [child for child in range(start, end) if not self.removed[level + 1][child]]
+
+    def _value(self, level, index):
+        value = self.values[level][index]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def _position(self, level, index):
+        position = self.positions[level][index]
+        if position < 0:
+            return None
+        return int(position)
+
+    def _set_position(self, level, index, position):
+        self.positions[level][index] = -1 if position is None else position
+
+    def _result(self, level, index):
+        if self.results[level] is None:
+            return None
+        return self.results[level][index]
+
+    def _set_result(self, level, index, result):
+        self.compact()
+        if self.results[level] is None:
+            self.results[level] = np.full(len(self.values[level]), None, dtype=object)
+        self.results[level][index] = result
+
+    def _remove(self, level, index):
+        self.compact()
+        while level > 0:
+            if self.removed[level] is None:
+                self.removed[level] = np.zeros(len(self.values[level]), dtype=bool)
+            self.removed[level][index] = True
+            # Like in an IndexTree, a node whose children were all removed is removed as well
+            parent = self.parents[level][index]
+            start, end = self.child_offsets[level - 1][parent], self.child_offsets[level - 1][parent + 1]
+            if not np.all(self.removed[level][start:end]):
+                break
+            level, index = level - 1, parent
+
+
+class ColumnarIndexTreeNode(object):
+    def __init__(self, tree, level, index):
+        self._tree = tree
+        self._level = level
+        self._index = index
+
+    @property
+    def axis(self):
+        return self._tree.axes[self._level]
+
+    @property
+    def value(self):
+        return self._tree._value(self._level, self._index)
+
+    @property
+    def position(self):
+        return self._tree._position(self._level, self._index)
+
+    @position.setter
+    def position(self, position):
+        self._tree._set_position(self._level, self._index, position)
+
+    @property
+    def result(self):
+        return self._tree._result(self._level, self._index)
+
+    @result.setter
+    def result(self, result):
+        self._tree._set_result(self._level, self._index, result)
+
+    @property
+    def parent(self):
+        if self._level == 0:
+            return None
+        return ColumnarIndexTreeNode(self._tree, self._level - 1, self._tree.parents[self._level][self._index])
+
+    @property
+    def children(self):
+        return [ColumnarIndexTreeNode(self._tree, self._level + 1, i) for i in self._tree._child_indexes(*self._key)]
+
+    @property
+    def leaves(self):
+        return list(self.iter_leaves())
+
+    def iter_leaves(self):
+        stack = [self._key]
+        while len(stack) > 0:
+            level, index = stack.pop()
+            children = self._tree._child_indexes(level, index)
+            if len(children) == 0:
+                yield ColumnarIndexTreeNode(self._tree, level, index)
+            # Visit the children in order, like IndexTree.leaves
+            stack.extend((level + 1, child) for child in reversed(children))
+
+    def leaves_with_paths(self):
+        tree = self._tree
+        entries = list(self.flatten().items())[:-1] if self._level > 0 else []
+        stack = [(self._level, self._index, len(entries))]
+        while len(stack) > 0:
+            level, index, depth = stack.pop()
+            del entries[depth:]
+            if level > 0:
+                entries.append((tree.axes[level].name, tree._value(level, index)))
+            children = tree._child_indexes(level, index)
+            if len(children) == 0:
+                yield ColumnarIndexTreeNode(tree, level, index), DatacubePath(entries)
+            else:
+                stack.extend((level + 1, child, len(entries)) for child in reversed(children))
+
+    def chunked_leaves_with_paths(self, chunk_size):
+        return _chunks(self.leaves_with_paths(), chunk_size)
+
+    @property
+    def _key(self):
+        return (self._level, self._index)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __delitem__(self, key):
+        return delattr(self, key)
+
+    def __repr__(self):
+        return f"{self.axis.name}={self.value}"
+
+    def is_root(self):
+        return self._level == 0
+
+    def create_child(self, axis, value):
+        return ColumnarIndexTreeNode(self._tree, self._level + 1, self._tree._create_child(*self._key, axis, value))
+
+    def remove_branch(self):
+        self._tree._remove(*self._key)
+
+    def flatten(self):
+        path = DatacubePath()
+        ancestors = []
+        level, index = self._key
+        while level > 0:
+            ancestors.append((level, index))
+            level, index = level - 1, self._tree.parents[level][index]
+        for level, index in reversed(ancestors):
+            path[self._tree.axes[level].name] = self._tree._value(level, index)
+        return path
+
+
+def _chunks(iterable, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("The chunk size needs to be at least 1")
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+
+def _equal_values(values, others, tol):
+    # Like in an IndexTree, numbers within twice the tolerance of their axis are equal
+    if values.dtype.kind in "iuf" and tol > 0:
+        return np.abs(values - others) <= 2 * tol
+    return np.asarray(values == others, dtype=bool)
+
+
+def _to_array(values):
+    array = np.asarray(values)
+    if array.dtype.kind not in "biuf":
+        # Keep the original values, such as timestamps, instead of converting them to numpy types
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+    return array
+
+
+def _to_typed_array(values):
+    # Timestamps, timedeltas and strings are converted to numpy types, so that they can be loaded without pickle
+    types = set(map(type, values))
+    if types == {pd.Timestamp}:
+        return np.array(values, dtype="datetime64[ns]")
+    if types == {pd.Timedelta}:
+        return np.array(values, dtype="timedelta64[ns]")
+    if types == {str}:
+        return np.array(values, dtype=str)
+    if all(issubclass(t, Real) for t in types):
+        return np.asarray(values)
+    # Other values are kept as they are and pickled
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def _leaf_arrays(leaves_with_paths):
+    paths = []
+    results = []
+    for leaf, path in leaves_with_paths:
+        paths.append(path)
+        results.append(leaf.result)
+    axis_names = dict.fromkeys(name for path in paths for name in path.keys())
+    coords = {name: _to_typed_array([path.get(name) for path in paths]) for name in axis_names}
+    return coords, results
+
+
+def _result_values(results):
+    # The xarray and FDB datacubes return (key, value) results, while the mock datacube returns the values directly
+    names = [result[0] if isinstance(result, tuple) else None for result in results]
+    values = [result[1] if isinstance(result, tuple) else result for result in results]
+    return names, _to_typed_array([np.nan if value is None else value for value in values])
+
+
+def _to_dataset(coords, results):
+    names, values = _result_values(results)
+    unique_names = list(dict.fromkeys(names))
+    data_vars = {}
+    for name in unique_names:
+        var_name = name if name is not None else "values"
+        if len(unique_names) == 1:
+            data_vars[var_name] = ("points", values)
+        else:
+            data_vars[var_name] = ("points", np.where(np.array(names, dtype=object) == name, values, np.nan))
+    return xr.Dataset(data_vars, coords={name: ("points", array) for name, array in coords.items()})
+
+
+def _to_index_array(values):
+    return np.array(values, dtype=np.min_scalar_type(max(values, default=0)))
+
+
+def _from_npz_array(array):
+    if array.dtype.kind == "M":
+        return [pd.Timestamp(value) for value in array]
+    if array.dtype.kind == "m":
+        return [pd.Timedelta(value) for value in array]
+    return array.tolist()
+
+
+def _sort_order(parents, values):
+    if values.dtype == object:
+        return np.array(sorted(range(len(values)), key=lambda i: (parents[i], values[i])), dtype=np.int64)
+    return np.lexsort((values, parents))
@@ -1,79 +1,127 @@
 import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
-from itertools import chain
 from typing import List
 
+import numpy as np
 import scipy.spatial
 
 from ..datacube.backends.datacube import Datacube, IndexTree
 from ..datacube.datacube_axis import UnsliceableDatacubeAxis
+from ..datacube.index_tree import ColumnarIndexTree, DatacubePath
 from ..shapes import ConvexPolytope
-from ..utility.combinatorics import argmax, argmin, group, product, unique
-from ..utility.exceptions import UnsliceableShapeError
-from ..utility.geometry import lerp
+from ..utility.combinatorics import group, product
+from ..utility.exceptions import AxisNotFoundError, UnsliceableShapeError
 from .engine import Engine
 
+# State shared with the forked worker processes of a parallel extraction
+_worker_state = None
+
+# Marks the values a polytope was not sliced at yet in the slice cache, where None is an empty slice
+_NOT_SLICED = object()
+
 
 class HullSlicer(Engine):
-    def __init__(self):
-        pass
+    def __init__(self, parallel=False, max_workers=None, split_axis=None, columnar=False):
+        # When parallel is set, the independent polytope combinations are sliced in a pool of worker processes.
+        # If a split axis is also given, the children created on that axis are instead shared between the workers,
+        # which each carry on slicing their own subtrees.
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.split_axis = split_axis
+        # When columnar is set, the request is built as a ColumnarIndexTree instead of an IndexTree
+        self.columnar = columnar
+        self._slice_cache = {}
 
     def _unique_continuous_points(self, p: ConvexPolytope, datacube: Datacube):
         for i, ax in enumerate(p.axes()):
             mapper = datacube.get_mapper(ax)
             if isinstance(mapper, UnsliceableDatacubeAxis):
-                break
+                return
             for j, val in enumerate(p.points):
                 p.points[j] = list(p.points[j])
                 p.points[j][i] = mapper.to_float(mapper.parse(p.points[j][i]))
-        # Remove duplicate points
-        unique(p.points)
+        # Store the points as a float array for the slicing kernel and remove duplicate points
+        p.points = np.unique(np.asarray(p.points, dtype=np.float64), axis=0)
 
-    def _build_unsliceable_child(self, polytope, ax, node, datacube, lower, next_nodes):
+    def _build_unsliceable_child(self, polytope, ax, entry, datacube, lower, next_nodes):
+        node, unsliced_polytopes, path = entry
         if polytope.axes() != [ax.name]:
             raise UnsliceableShapeError(ax)
-        path = node.flatten()
-        if datacube.has_index(path, ax, lower):
+        if datacube.has_index(DatacubePath(path), ax, lower):
             child = node.create_child(ax, lower)
-            child["unsliced_polytopes"] = copy(node["unsliced_polytopes"])
-            child["unsliced_polytopes"].remove(polytope)
-            next_nodes.append(child)
+            if not _is_last_axis(datacube, ax):
+                child_polytopes = copy(unsliced_polytopes)
+                child_polytopes.remove(polytope)
+                next_nodes.append((child, child_polytopes, _child_path(path, child)))
         else:
             # raise a value not found error
             raise ValueError()
 
-    def _build_sliceable_child(self, polytope, ax, node, datacube, lower, upper, next_nodes):
+    def _build_sliceable_child(self, polytope, ax, entry, datacube, lower, upper, next_nodes):
+        node, unsliced_polytopes, path = entry
         tol = ax.tol
         lower = ax.from_float(lower - tol)
         upper = ax.from_float(upper + tol)
-        flattened = node.flatten()
+        # The datacube may modify the path it is given, so we give it a copy of the path of the node
+        flattened = DatacubePath(path)
         method = polytope.method
-        for value in datacube.get_indices(flattened, ax, lower, upper, method):
-            # convert to float for slicing
-            fvalue = ax.to_float(value)
-            new_polytope = slice(polytope, ax.name, fvalue)
+        values, positions = datacube.get_indices_and_positions(flattened, ax, lower, upper, method)
+        # convert to float for slicing and slice the polytope at all the values at once
+        fvalues = [ax.to_float(value) for value in values]
+        new_polytopes = self._slice_at_values(polytope, ax.name, fvalues)
+        last_axis = _is_last_axis(datacube, ax)
+        for i, (value, new_polytope) in enumerate(zip(values, new_polytopes)):
             # store the native type
             remapped_val = value
             if ax.is_cyclic:
                 remapped_val = (ax.remap([value, value])[0][0] + ax.remap([value, value])[0][1]) / 2
                 remapped_val = round(remapped_val, int(-math.log10(ax.tol)))
             child = node.create_child(ax, remapped_val)
-            child["unsliced_polytopes"] = copy(node["unsliced_polytopes"])
-            child["unsliced_polytopes"].remove(polytope)
+            if positions is not None:
+                # Record where the value is in the data, so the datacube does not need to look it up again
+                child.position = positions[i]
+            if last_axis:
+                # The children on the last axis are not sliced any further, so the slicer keeps no state for them
+                continue
+            child_polytopes = copy(unsliced_polytopes)
+            child_polytopes.remove(polytope)
             if new_polytope is not None:
-                child["unsliced_polytopes"].add(new_polytope)
-            next_nodes.append(child)
+                child_polytopes.add(new_polytope)
+            next_nodes.append((child, child_polytopes, _child_path(path, child)))
 
-    def _build_branch(self, ax, node, datacube, next_nodes):
-        for polytope in node["unsliced_polytopes"]:
+    def _slice_at_values(self, polytope, axis, values):
+        # Identical polytopes are often sliced at the same values, for example the same triangle of a polygon in
+        # every combination with the other shapes of the request, so we reuse the slices computed during this extraction
+        # The slices of 1D polytopes are always empty and there is one of them per leaf, so they are not kept
+        if len(polytope.axes()) < 2:
+            return slice_at_values(polytope, axis, values)
+        slices = self._slice_cache.get((polytope, axis))
+        if slices is None:
+            slices = {}
+            self._slice_cache[(polytope, axis)] = slices
+        new_polytopes = [slices.get(value, _NOT_SLICED) for value in values]
+        missing = [i for i, new_polytope in enumerate(new_polytopes) if new_polytope is _NOT_SLICED]
+        if len(missing) > 0:
+            for i, new_polytope in zip(missing, slice_at_values(polytope, axis, [values[i] for i in missing])):
+                slices[values[i]] = new_polytope
+                new_polytopes[i] = new_polytope
+        return new_polytopes
+
+    def _build_branch(self, ax, entry, datacube, next_nodes):
+        # The nodes being built are (node, unsliced polytopes, path) entries, so the state of the slicer is only kept
+        # until the next level is built and not on the request tree
+        _, unsliced_polytopes, _ = entry
+        for polytope in unsliced_polytopes:
             if ax.name in polytope.axes():
                 lower, upper = polytope.extents(ax.name)
                 # here, first check if the axis is an unsliceable axis and directly build node if it is
                 if isinstance(ax, UnsliceableDatacubeAxis):
-                    self._build_unsliceable_child(polytope, ax, node, datacube, lower, next_nodes)
+                    self._build_unsliceable_child(polytope, ax, entry, datacube, lower, next_nodes)
                 else:
-                    self._build_sliceable_child(polytope, ax, node, datacube, lower, upper, next_nodes)
-        del node["unsliced_polytopes"]
+                    self._build_sliceable_child(polytope, ax, entry, datacube, lower, upper, next_nodes)
 
     def extract(self, datacube: Datacube, polytopes: List[ConvexPolytope]):
         # Convert the polytope points to float type to support triangulation and interpolation
@@ -82,79 +130,168 @@ class HullSlicer(Engine):
 
         groups, input_axes = group(polytopes)
         datacube.validate(input_axes)
-        request = IndexTree()
-        combinations = product(groups)
+        request = ColumnarIndexTree() if self.columnar else IndexTree()
+        combinations = self._combinations(datacube, groups)
+        self._slice_cache = {}
+
+        if self.split_axis is not None and self.split_axis not in datacube.axes:
+            raise AxisNotFoundError(self.split_axis)
+
+        if self.parallel and self.split_axis is None and len(combinations) > 1 and _can_fork():
+            self._extract_parallel(datacube, combinations, request)
+        elif self.parallel and self.split_axis is not None and _can_fork():
+            self._extract_split(datacube, combinations, request)
+        else:
+            for c in combinations:
+                if self.columnar:
+                    # The columnar tree merges the combinations as they are built into it
+                    self._extract_combination(datacube, c, request.root)
+                else:
+                    r = self._extract_combination(datacube, c)
+                    request.merge(r)
+        self._slice_cache = {}
+        if self.columnar:
+            request.compact()
+        return request
+
+    def _combinations(self, datacube, groups):
+        return product(groups)
 
+    def _extract_combination(self, datacube, combination, r=None):
+        r = IndexTree() if r is None else r
+        # The path of each node is carried down the tree as it is built, instead of walking up to the root every time
+        self._build_levels(datacube, [(r, set(combination), DatacubePath())], list(datacube.axes.values()))
+        return r
+
+    def _build_levels(self, datacube, current_nodes, axes):
+        for ax in axes:
+            next_nodes = []
+            for entry in current_nodes:
+                self._build_branch(ax, entry, datacube, next_nodes)
+            current_nodes = next_nodes
+        return current_nodes
+
+    def _build_levels_parallel(self, datacube, nodes, axes):
+        if len(axes) == 0 or len(nodes) < 2:
+            self._build_levels(datacube, nodes, axes)
+            return
+        all_branches = self._map_in_workers(_build_subtree_worker, (self, datacube, nodes, axes), len(nodes))
+        for (node, _, _), branches in zip(nodes, all_branches):
+            # The workers sliced the remaining polytopes of this node, so we stitch their subtree back under it
+            _merge_branches(node, branches, datacube)
+
+    def _extract_split(self, datacube, combinations, request):
+        # All the combinations are sliced down to the split axis first, so that the subtrees below the split axis of
+        # every combination are then shared between the workers of a single pool
+        axes = list(datacube.axes.values())
+        split_idx = [ax.name for ax in axes].index(self.split_axis) + 1
+        trees = []
+        split_nodes = []
         for c in combinations:
             r = IndexTree()
-            r["unsliced_polytopes"] = set(c)
-            current_nodes = [r]
-            for ax in datacube.axes.values():
-                next_nodes = []
-                for node in current_nodes:
-                    self._build_branch(ax, node, datacube, next_nodes)
-                current_nodes = next_nodes
-            request.merge(r)
-        return request
+            split_nodes.extend(self._build_levels(datacube, [(r, set(c), DatacubePath())], axes[:split_idx]))
+            trees.append(r)
+        self._build_levels_parallel(datacube, split_nodes, axes[split_idx:])
+        for r in trees:
+            if self.columnar:
+                _merge_branches(request.root, _tree_to_branches(r), datacube)
+            else:
+                request.merge(r)
 
+    def _extract_parallel(self, datacube, combinations, request):
+        state = (self, datacube, combinations)
+        all_branches = self._map_in_workers(_extract_combination_worker, state, len(combinations))
+        for branches in all_branches:
+            _merge_branches(request, branches, datacube)
 
-def _find_intersects(polytope, slice_axis_idx, value):
-    intersects = []
-    # Find all points above and below slice axis
-    above_slice = [p for p in polytope.points if p[slice_axis_idx] >= value]
-    below_slice = [p for p in polytope.points if p[slice_axis_idx] <= value]
-
-    # Get the intersection of every pair above and below, this will create excess interior points
-    for a in above_slice:
-        for b in below_slice:
-            # edge is incident with slice plane, don't need these points
-            if a[slice_axis_idx] == b[slice_axis_idx]:
-                intersects.append(b)
-                continue
+    def _map_in_workers(self, worker, state, n):
+        global _worker_state
+        # The workers are forked so that they inherit the datacube and polytopes instead of having to pickle them
+        _worker_state = state
+        max_workers = self.max_workers if self.max_workers is not None else os.cpu_count()
+        chunksize = max(1, n // (4 * max_workers))
+        try:
+            # The results are all collected before the pool is shut down and the shared state is reset
+            with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                return list(executor.map(worker, range(n), chunksize=chunksize))
+        finally:
+            _worker_state = None
 
-            # Linearly interpolate all coordinates of two points (a,b) of the polytope
-            interp_coeff = (value - b[slice_axis_idx]) / (a[slice_axis_idx] - b[slice_axis_idx])
-            intersect = lerp(a, b, interp_coeff)
-            intersects.append(intersect)
-    return intersects
 
+def _child_path(path, child):
+    child_path = DatacubePath(path)
+    child_path[child.axis.name] = child.value
+    return child_path
 
-def _reduce_dimension(intersects, slice_axis_idx):
-    temp_intersects = []
-    for point in intersects:
-        point = [p for i, p in enumerate(point) if i != slice_axis_idx]
-        temp_intersects.append(point)
-    return temp_intersects
 
+def _is_last_axis(datacube, ax):
+    return next(reversed(datacube.axes)) == ax.name
 
-def slice(polytope: ConvexPolytope, axis, value):
-    slice_axis_idx = polytope._axes.index(axis)
 
-    if len(polytope.points[0]) == 1:
-        # Note that in this case, we do not need to do linear interpolation so we can save time
-        if value in chain(*polytope.points):
-            intersects = [[value]]
-        else:
-            return None
-    else:
-        intersects = _find_intersects(polytope, slice_axis_idx, value)
+def _can_fork():
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _extract_combination_worker(i):
+    slicer, datacube, combinations = _worker_state
+    return _tree_to_branches(slicer._extract_combination(datacube, combinations[i]))
+
+
+def _build_subtree_worker(i):
+    slicer, datacube, nodes, axes = _worker_state
+    slicer._build_levels(datacube, [nodes[i]], axes)
+    return _tree_to_branches(nodes[i][0])
+
 
+def _tree_to_branches(node):
+    # Picklable form of an index tree, which refers to its axes by name
+    return [(child.axis.name, child.value, child.position, _tree_to_branches(child)) for child in node.children]
+
+
+def _merge_branches(node, branches, datacube):
+    for axis_name, value, position, sub_branches in branches:
+        child = node.create_child(datacube.axes[axis_name], value)
+        child.position = position
+        _merge_branches(child, sub_branches, datacube)
+
+
+def _find_intersects(points, slice_axis_idx, value):
+    # Find all points above and below slice axis
+    above_slice = points[points[:, slice_axis_idx] >= value]
+    below_slice = points[points[:, slice_axis_idx] <= value]
+
+    # Get the intersection of every pair above and below in one broadcast operation, this will create excess
+    # interior points
+    a = above_slice[:, np.newaxis, :]
+    b = below_slice[np.newaxis, :, :]
+    delta = a[..., slice_axis_idx] - b[..., slice_axis_idx]
+    # When the edge is incident with the slice plane, we keep the point below and don't interpolate
+    incident = delta == 0
+    interp_coeff = np.divide(value - b[..., slice_axis_idx], delta, out=np.zeros_like(delta), where=~incident)
+    # Linearly interpolate all coordinates of every pair (a,b) of the polytope
+    intersects = b + interp_coeff[..., np.newaxis] * (a - b)
+    return intersects.reshape(-1, points.shape[1])
+
+
+def _reduce_dimension(intersects, slice_axis_idx):
+    return np.delete(intersects, slice_axis_idx, axis=1)
+
+
+def _polytope_from_intersects(intersects, slice_axis_idx, axes):
     if len(intersects) == 0:
         return None
 
-    # Reduce dimension of intersection points, removing slice axis
-    intersects = _reduce_dimension(intersects, slice_axis_idx)
+    # Reduce dimension of intersection points, removing slice axis, and remove the duplicated points
+    intersects = np.unique(_reduce_dimension(intersects, slice_axis_idx), axis=0)
 
-    axes = [ax for ax in polytope.axes() if ax != axis]
-
-    if len(intersects) < len(intersects[0]) + 1:
+    if len(intersects) < intersects.shape[1] + 1:
         return ConvexPolytope(axes, intersects)
     # Compute convex hull (removing interior points)
-    if len(intersects[0]) == 0:
+    if intersects.shape[1] == 0:
         return None
-    elif len(intersects[0]) == 1:  # qhull doesn't like 1D, do it ourselves
-        amin = argmin(intersects)
-        amax = argmax(intersects)
+    elif intersects.shape[1] == 1:  # qhull doesn't like 1D, do it ourselves
+        amin = np.argmin(intersects[:, 0])
+        amax = np.argmax(intersects[:, 0])
         vertices = [amin, amax]
     else:
         try:
@@ -165,4 +302,163 @@ def slice(polytope: ConvexPolytope, axis, value):
             if "input is less than" or "simplex is flat" in str(e):
                 return ConvexPolytope(axes, intersects)
     # Sliced result is simply the convex hull
-    return ConvexPolytope(axes, [intersects[i] for i in vertices])
+    return ConvexPolytope(axes, intersects[vertices])
+
+
+def slice(polytope: ConvexPolytope, axis, value):
+    slice_axis_idx = polytope._axes.index(axis)
+    points = np.asarray(polytope.points, dtype=np.float64)
+    axes = [ax for ax in polytope.axes() if ax != axis]
+
+    if points.shape[1] == 1:
+        # Note that in this case, we do not need to do linear interpolation so we can save time
+        if np.any(points[:, 0] == value):
+            intersects = np.array([[value]], dtype=np.float64)
+        else:
+            return None
+    elif polytope.is_orthogonal:
+        return _slice_box_at_values(points, slice_axis_idx, np.array([value], dtype=np.float64), axes)[0]
+    elif points.shape[1] == 2:
+        # The slice of a 2D polytope is an interval, which we can compute directly
+        return _slice_2D_at_values(points, slice_axis_idx, np.array([value], dtype=np.float64), axes)[0]
+    else:
+        intersects = _find_intersects(points, slice_axis_idx, value)
+
+    return _polytope_from_intersects(intersects, slice_axis_idx, axes)
+
+
+def _convex_ring_2D(points):
+    # Andrew's monotone chain, returns the vertices of the convex hull of 2D points in counter-clockwise order
+    points = np.unique(points, axis=0)
+    if len(points) <= 2:
+        return points
+
+    def half_hull(ordered_points):
+        hull = []
+        for p in ordered_points:
+            while len(hull) >= 2:
+                o, a = hull[-2], hull[-1]
+                if (a[0] - o[0]) * (p[1] - o[1]) - (a[1] - o[1]) * (p[0] - o[0]) > 0:
+                    break
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    return np.array(half_hull(points) + half_hull(points[::-1]))
+
+
+def _is_axis_aligned_box(points):
+    # A 2D polytope is an axis-aligned box if its vertices are exactly the corners of its bounding box
+    points = np.unique(points, axis=0)
+    lower = points.min(axis=0)
+    upper = points.max(axis=0)
+    on_corner = np.all((points == lower) | (points == upper), axis=1)
+    return bool(np.all(on_corner)) and len(points) == 2 ** np.count_nonzero(upper > lower)
+
+
+def _slice_box_at_values(points, slice_axis_idx, values, axes):
+    # Every slice of an axis-aligned box is the same lower-dimensional box, so we only need a range lookup on the
+    # slice axis and never compute any intersection or hull
+    lower = points[:, slice_axis_idx].min()
+    upper = points[:, slice_axis_idx].max()
+    inside = (lower <= values) & (values <= upper)
+    results = [None] * len(values)
+    if not np.any(inside):
+        return results
+    sliced_box = ConvexPolytope(axes, np.unique(_reduce_dimension(points, slice_axis_idx), axis=0), is_orthogonal=True)
+    for i in np.nonzero(inside)[0]:
+        results[i] = sliced_box
+    return results
+
+
+def _intervals_2D(points, slice_axis_idx, values):
+    # Closed-form slicing of a 2D polytope into 1D intervals, without building any intersection points or hulls.
+    # Returns which values cut the polytope and the [lower, upper] interval of the other axis at each of them.
+    other_axis_idx = 1 - slice_axis_idx
+    lower = points[:, slice_axis_idx].min()
+    upper = points[:, slice_axis_idx].max()
+    inside = (lower <= values) & (values <= upper)
+
+    if _is_axis_aligned_box(points):
+        # Every slice of an axis-aligned box is the same interval
+        interval_lower = np.full(len(values), points[:, other_axis_idx].min())
+        interval_upper = np.full(len(values), points[:, other_axis_idx].max())
+        return inside, interval_lower, interval_upper
+
+    # Find the [min, max] crossing of the slice plane with each edge of the polygon
+    ring = _convex_ring_2D(points)
+    a = ring
+    b = np.roll(ring, -1, axis=0)
+    a_coord = a[:, slice_axis_idx]
+    b_coord = b[:, slice_axis_idx]
+    values = values[:, np.newaxis]
+    crossing = (np.minimum(a_coord, b_coord) <= values) & (values <= np.maximum(a_coord, b_coord))
+    delta = a_coord - b_coord
+    incident = delta == 0
+    interp_coeff = np.divide(values - b_coord, delta, out=np.zeros(crossing.shape), where=~incident)
+    crossings = b[:, other_axis_idx] + interp_coeff * (a[:, other_axis_idx] - b[:, other_axis_idx])
+    # Edges incident with the slice plane contribute both their end points
+    crossing_lower = np.where(incident, np.minimum(a[:, other_axis_idx], b[:, other_axis_idx]), crossings)
+    crossing_upper = np.where(incident, np.maximum(a[:, other_axis_idx], b[:, other_axis_idx]), crossings)
+    interval_lower = np.where(crossing, crossing_lower, np.inf).min(axis=1)
+    interval_upper = np.where(crossing, crossing_upper, -np.inf).max(axis=1)
+    return inside, interval_lower, interval_upper
+
+
+def _slice_2D_at_values(points, slice_axis_idx, values, axes):
+    results = [None] * len(values)
+    inside, interval_lower, interval_upper = _intervals_2D(points, slice_axis_idx, values)
+    for i in np.nonzero(inside)[0]:
+        if interval_lower[i] == interval_upper[i]:
+            interval = [[interval_lower[i]]]
+        else:
+            interval = [[interval_lower[i]], [interval_upper[i]]]
+        results[i] = ConvexPolytope(axes, np.array(interval, dtype=np.float64))
+    return results
+
+
+def slice_at_values(polytope: ConvexPolytope, axis, values):
+    """Slice a polytope at every value along an axis in one sweep, returning one (possibly None) polytope per value"""
+    results = [None] * len(values)
+    if len(values) == 0 or len(polytope.axes()) == 1:
+        # The slice of a 1D polytope has no dimension left, so it is always empty
+        return results
+    slice_axis_idx = polytope._axes.index(axis)
+    points = np.asarray(polytope.points, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    axes = [ax for ax in polytope.axes() if ax != axis]
+
+    if polytope.is_orthogonal:
+        return _slice_box_at_values(points, slice_axis_idx, values, axes)
+    if points.shape[1] == 2:
+        return _slice_2D_at_values(points, slice_axis_idx, values, axes)
+
+    # Sort the vertices along the slice axis once and build the list of vertex pairs (a, b) with a above b,
+    # which is the edge list every slice plane cuts through
+    points = points[np.argsort(points[:, slice_axis_idx], kind="stable")]
+    coords = points[:, slice_axis_idx]
+    upper_idx, lower_idx = np.nonzero(coords[:, np.newaxis] >= coords[np.newaxis, :])
+    a = points[upper_idx]
+    b = points[lower_idx]
+    delta = a[:, slice_axis_idx] - b[:, slice_axis_idx]
+    incident = delta == 0
+
+    # Only the values which lie inside the extents of the polytope along the axis can give a non-empty slice
+    order = np.argsort(values, kind="stable")
+    start = np.searchsorted(values[order], coords[0], "left")
+    end = np.searchsorted(values[order], coords[-1], "right")
+    for i in order[start:end]:
+        value = values[i]
+        # An edge is cut by the slice plane when its end points lie on either side of the plane
+        crossing = (b[:, slice_axis_idx] <= value) & (value <= a[:, slice_axis_idx])
+        pair_delta = delta[crossing]
+        pair_b = b[crossing]
+        interp_coeff = np.divide(
+            value - pair_b[:, slice_axis_idx],
+            pair_delta,
+            out=np.zeros_like(pair_delta),
+            where=~incident[crossing],
+        )
+        intersects = pair_b + interp_coeff[:, np.newaxis] * (a[crossing] - pair_b)
+        results[i] = _polytope_from_intersects(intersects, slice_axis_idx, axes)
+    return results
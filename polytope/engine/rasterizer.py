@@ -0,0 +1,130 @@
+import math
+from copy import copy
+from typing import List
+
+import numpy as np
+
+from ..datacube.backends.datacube import Datacube
+from ..datacube.index_tree import DatacubePath
+from ..datacube.transformations.datacube_mappers import DatacubeMapper
+from ..shapes import ConvexPolytope
+from ..utility.combinatorics import product
+from .hullslicer import HullSlicer, _intervals_2D, _is_last_axis
+
+
+class PolygonRasterizer(HullSlicer):
+    """
+    Engine which extracts the 2D shapes on the two axes of a grid mapper (e.g. latitude and longitude) by scanline
+    rasterization against the discrete grid, and slices the other axes with the hull slicer.
+    """
+
+    def __init__(self, parallel=False, max_workers=None, split_axis=None, columnar=False):
+        super().__init__(parallel, max_workers, split_axis, columnar)
+        self._raster = None
+
+    def extract(self, datacube: Datacube, polytopes: List[ConvexPolytope]):
+        try:
+            return super().extract(datacube, polytopes)
+        finally:
+            self._raster = None
+
+    def _combinations(self, datacube, groups):
+        # The 2D shapes on the mapped axes are all rasterized together, so they are taken out of the combinations
+        self._raster = None
+        mapped_axes = _rasterizable_axes(datacube)
+        if mapped_axes is not None:
+            key = tuple(sorted(ax.name for ax in mapped_axes))
+            region = groups.get(key, [])
+            if len(region) > 0 and all(p.method is None for p in region):
+                groups = {k: g for k, g in groups.items() if k != key}
+                self._raster = (*mapped_axes, _rasterize(datacube, *mapped_axes, region))
+        return product(groups)
+
+    def _build_branch(self, ax, entry, datacube, next_nodes):
+        if self._raster is None:
+            return super()._build_branch(ax, entry, datacube, next_nodes)
+        first_axis, second_axis, rows = self._raster
+        if ax.name == first_axis.name:
+            node, unsliced_polytopes, path = entry
+            last_axis = _is_last_axis(datacube, second_axis)
+            for first_value, second_values in rows:
+                first_child = node.create_child(first_axis, first_value)
+                for second_value in second_values:
+                    child = first_child.create_child(second_axis, second_value)
+                    if not last_axis:
+                        child_path = DatacubePath(path)
+                        child_path[first_axis.name] = first_child.value
+                        child_path[second_axis.name] = child.value
+                        next_nodes.append((child, copy(unsliced_polytopes), child_path))
+        elif ax.name == second_axis.name:
+            # The children on the second axis were already built with the first axis
+            next_nodes.append(entry)
+        else:
+            super()._build_branch(ax, entry, datacube, next_nodes)
+
+
+def _rasterizable_axes(datacube):
+    # Find the two axes created by a grid mapper, which need to follow each other in the datacube without any other
+    # transformation for the rasterized nodes to be those the hull slicer would build
+    axes = list(datacube.axes.values())
+    for i, ax in enumerate(axes[:-1]):
+        if not ax.has_mapper:
+            continue
+        for transformation in ax.transformations:
+            if not isinstance(transformation, DatacubeMapper):
+                continue
+            first_name, second_name = transformation._mapped_axes()
+            if ax.name != first_name or axes[i + 1].name != second_name:
+                continue
+            mapped_axes = (ax, axes[i + 1])
+            if any(a.is_cyclic or a.has_merger or a.reorder or a.type_change for a in mapped_axes):
+                return None
+            return mapped_axes
+    return None
+
+
+def _rasterize(datacube, first_axis, second_axis, region):
+    # The grid points of the mapped axes do not depend on the rest of the path, so we rasterize the region only once
+    # and return the rows of the grid it covers, each as a first axis value and the second axis values inside it
+    first_values = list(first_axis.find_indexes({}, datacube))
+    first_order = np.argsort(first_values, kind="stable")
+    first_sorted = np.asarray(first_values, dtype=np.float64)[first_order]
+    # Like Datacube.get_indices, we return the grid points rounded to the tolerance of the axis
+    first_rounded = [_round_to_tol(first_axis, first_values[i]) for i in first_order]
+    covered = np.zeros(len(first_values), dtype=bool)
+    intervals = {}
+
+    for p in region:
+        points = np.asarray(p.points, dtype=np.float64)
+        first_idx = p.axes().index(first_axis.name)
+        # Rows within tolerance of the polytope have a node, even when the row lies just outside of the polytope
+        lower, upper = p.extents(first_axis.name)
+        start = np.searchsorted(first_sorted, lower - first_axis.tol, "left")
+        end = np.searchsorted(first_sorted, upper + first_axis.tol, "right")
+        covered[start:end] = True
+        rounded = np.asarray(first_rounded[start:end], dtype=np.float64)
+        inside, interval_lower, interval_upper = _intervals_2D(points, first_idx, rounded)
+        for i in np.nonzero(inside)[0]:
+            interval = (interval_lower[i] - second_axis.tol, interval_upper[i] + second_axis.tol)
+            intervals.setdefault(start + i, []).append(interval)
+
+    rows = []
+    for i in np.nonzero(covered)[0]:
+        first_value = first_rounded[i]
+        second_values = []
+        if i in intervals:
+            path = {first_axis.name: first_value}
+            row = list(second_axis.find_indexes(path, datacube))
+            row_order = np.argsort(row, kind="stable")
+            row_sorted = np.asarray(row, dtype=np.float64)[row_order]
+            # Scan the row once for every interval of the region it crosses and keep each grid point only once
+            in_row = np.zeros(len(row), dtype=bool)
+            for lower, upper in intervals[i]:
+                in_row[np.searchsorted(row_sorted, lower, "left") : np.searchsorted(row_sorted, upper, "right")] = True
+            second_values = [_round_to_tol(second_axis, row[j]) for j in row_order[in_row]]
+        rows.append((first_value, second_values))
+    return rows
+
+
+def _round_to_tol(axis, value):
+    return round(value, int(-math.log10(axis.tol)))
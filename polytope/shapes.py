@@ -3,7 +3,9 @@ import math
 from abc import ABC, abstractmethod
 from typing import List
 
-import tripy
+import numpy as np
+
+from .utility.geometry import triangulate
 
 """
 Shapes used for the constructive geometry API of Polytope
@@ -23,13 +25,59 @@ class Shape(ABC):
 
 
 class ConvexPolytope(Shape):
-    def __init__(self, axes, points, method=None):
+    # Number of decimals the vertices are rounded to when comparing or hashing polytopes
+    vertices_decimals = 12
+
+    def __init__(self, axes, points, method=None, is_orthogonal=False):
         self._axes = list(axes)
         self.points = points
         self.method = method
+        # An orthogonal polytope is an axis-aligned box, which the slicer can slice without any geometry
+        self.is_orthogonal = is_orthogonal
+
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self._vertices_key = None
+        self._hash = None
+
+    def _canonical_vertices(self):
+        # The float vertices of the slicer are not modified in place, so we can compute their key only once
+        if isinstance(self._points, np.ndarray) and self._points.dtype == np.float64:
+            if self._vertices_key is None:
+                vertices = np.round(self._points, self.vertices_decimals) + 0.0
+                vertices = np.unique(vertices, axis=0)
+                self._vertices_key = (vertices.shape, vertices.tobytes())
+            return self._vertices_key
+        return tuple(sorted((tuple(point) for point in self._points), key=repr))
+
+    def _key(self):
+        return (tuple(self._axes), self.method, self._canonical_vertices())
+
+    def __hash__(self):
+        # The polytopes are hashed every time they are added to or removed from the set of a node, so like the key of
+        # the float vertices, their hash is only computed once
+        if self._hash is not None:
+            return self._hash
+        key_hash = hash(self._key())
+        if isinstance(self._points, np.ndarray) and self._points.dtype == np.float64:
+            self._hash = key_hash
+        return key_hash
+
+    def __eq__(self, other):
+        if not isinstance(other, ConvexPolytope):
+            return False
+        return self._key() == other._key()
 
     def extents(self, axis):
         slice_axis_idx = self.axes().index(axis)
+        if isinstance(self.points, np.ndarray):
+            axis_values = self.points[:, slice_axis_idx]
+            return (axis_values.min(), axis_values.max())
         axis_values = [point[slice_axis_idx] for point in self.points]
         lower = min(axis_values)
         upper = max(axis_values)
@@ -119,7 +167,7 @@ class Box(Shape):
         return self._axes
 
     def polytope(self):
-        return [ConvexPolytope(self.axes(), self.vertices)]
+        return [ConvexPolytope(self.axes(), self.vertices, is_orthogonal=True)]
 
 
 class Disk(Shape):
@@ -291,25 +339,83 @@ class Union(Shape):
 class Polygon(Shape):
     """2-D polygon defined by a set of exterior points"""
 
-    def __init__(self, axes, points):
+    # The polygon is either decomposed into triangles, or into convex pieces obtained by merging these triangles
+    decompositions = ["convex", "triangles"]
+
+    def __init__(self, axes, points, decomposition="convex"):
         self._axes = axes
         assert len(axes) == 2
         for p in points:
             assert len(p) == 2
+        assert decomposition in self.decompositions
 
-        triangles = tripy.earclip(points)
+        triangles = triangulate(points)
         self.polytopes = []
 
         if len(points) > 0 and len(triangles) == 0:
             self.polytopes = [ConvexPolytope(self.axes(), points)]
 
         else:
-            for t in triangles:
-                tri_points = [list(point) for point in t]
-                self.polytopes.append(ConvexPolytope(self.axes(), tri_points))
+            if decomposition == "convex":
+                pieces = _merge_convex_pieces(triangles)
+            else:
+                pieces = triangles
+            for piece in pieces:
+                piece_points = [list(point) for point in piece]
+                self.polytopes.append(ConvexPolytope(self.axes(), piece_points))
 
     def axes(self):
         return self._axes
 
     def polytope(self):
         return self.polytopes
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _merge_convex_pieces(triangles):
+    # Hertel-Mehlhorn decomposition: remove the diagonals between neighbouring pieces of the triangulation as long
+    # as the merged piece stays convex, which gives at most four times the minimal number of convex pieces
+    pieces = {}
+    edges = {}
+    degenerate_pieces = []
+    for triangle in triangles:
+        triangle = [tuple(point) for point in triangle]
+        area = _cross(*triangle)
+        if area == 0:
+            degenerate_pieces.append(triangle)
+            continue
+        if area < 0:
+            triangle = triangle[::-1]
+        piece_id = len(pieces) + len(degenerate_pieces)
+        pieces[piece_id] = triangle
+        for i in range(3):
+            edges[(triangle[i], triangle[(i + 1) % 3])] = piece_id
+
+    for u, v in list(edges.keys()):
+        first_id = edges.get((u, v))
+        second_id = edges.get((v, u))
+        if first_id is None or second_id is None or first_id == second_id:
+            continue
+        # Rotate the counter-clockwise pieces so that the first goes from v to u and the second from u to v
+        first = _rotate_to_edge(pieces[first_id], u, v)
+        second = _rotate_to_edge(pieces[second_id], v, u)
+        merged = first + second[1:-1]
+        # Only the two end points of the diagonal can become reflex vertices
+        if _cross(first[-2], u, second[1]) >= 0 and _cross(second[-2], v, first[1]) >= 0:
+            pieces[first_id] = merged
+            del pieces[second_id]
+            del edges[(u, v)]
+            del edges[(v, u)]
+            for i in range(len(second) - 1):
+                edges[(second[i], second[i + 1])] = first_id
+    return list(pieces.values()) + degenerate_pieces
+
+
+def _rotate_to_edge(piece, u, v):
+    # Rotate the piece so that it starts at v and ends at u, where (u, v) is one of its edges
+    for i in range(len(piece)):
+        if piece[i - 1] == u and piece[i] == v:
+            return piece[i:] + piece[:i]
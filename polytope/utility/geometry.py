@@ -1,4 +1,284 @@
+import numpy as np
+from sortedcontainers import SortedList
+
+
 def lerp(a, b, value):
     direction = [a - b for a, b in zip(a, b)]
     intersect = [b + value * d for b, d in zip(b, direction)]
     return intersect
+
+
+# Vertex types of the sweep line which partitions a polygon into y-monotone pieces
+_START, _END, _SPLIT, _MERGE, _REGULAR = range(5)
+
+
+def triangulate(points):
+    # Triangulate a simple polygon in O(n log n) by first partitioning it into y-monotone pieces with a sweep line,
+    # and then triangulating each monotone piece in linear time (see de Berg et al., Computational Geometry, ch. 3).
+    # Like tripy.earclip, this returns a list of triangles, each given as a tuple of three of the polygon points.
+    vertices = _polygon_vertices(points)
+    if len(vertices) < 3:
+        return []
+    coords = np.array(vertices, dtype=np.float64)
+    x, y = coords[:, 0], coords[:, 1]
+    signed_area = np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)
+    if signed_area == 0:
+        # Like tripy.earclip, there are no triangles in a flat polygon
+        return []
+    if signed_area < 0:
+        # Make sure the polygon is counter-clockwise
+        vertices = vertices[::-1]
+        coords = coords[::-1]
+
+    # The sweep line goes from top to bottom, and from left to right for vertices at the same height
+    order = np.lexsort((coords[:, 0], -coords[:, 1]))
+    rank = np.empty(len(vertices), dtype=np.int64)
+    rank[order] = np.arange(len(vertices))
+
+    diagonals = _monotone_diagonals(coords, order, rank)
+    triangles = []
+    for piece in _split_pieces(coords, diagonals):
+        for a, b, c in _triangulate_monotone(coords, piece, rank):
+            triangles.append((vertices[a], vertices[b], vertices[c]))
+    return triangles
+
+
+def _polygon_vertices(points):
+    vertices = []
+    for point in points:
+        point = tuple(point)
+        if len(vertices) == 0 or point != vertices[-1]:
+            vertices.append(point)
+    # Shapefiles repeat the first point to close the polygon
+    while len(vertices) > 1 and vertices[0] == vertices[-1]:
+        vertices.pop()
+    return vertices
+
+
+def _cross(coords, o, a, b):
+    return (coords[a, 0] - coords[o, 0]) * (coords[b, 1] - coords[o, 1]) - (coords[a, 1] - coords[o, 1]) * (
+        coords[b, 0] - coords[o, 0]
+    )
+
+
+def _vertex_types(coords, rank):
+    n = len(coords)
+    idx = np.arange(n)
+    prev_idx = np.roll(idx, 1)
+    next_idx = np.roll(idx, -1)
+    prev_below = rank[prev_idx] > rank
+    next_below = rank[next_idx] > rank
+    convex = _cross(coords, prev_idx, idx, next_idx) >= 0
+    types = np.full(n, _REGULAR)
+    types[prev_below & next_below & convex] = _START
+    types[prev_below & next_below & ~convex] = _SPLIT
+    types[~prev_below & ~next_below & convex] = _END
+    types[~prev_below & ~next_below & ~convex] = _MERGE
+    return types
+
+
+class _SweepEdge:
+    # An edge of the sweep line status, ordered by where it crosses the sweep line. The edges of a simple polygon do
+    # not cross, so their order does not change while they are in the status and they can be kept in a SortedList.
+    __slots__ = ["edge", "x0", "y0", "x1", "y1", "y_low", "sweep"]
+
+    def __init__(self, coords, edge, sweep):
+        self.edge = edge
+        end = (edge + 1) % len(coords)
+        self.x0, self.y0 = float(coords[edge, 0]), float(coords[edge, 1])
+        self.x1, self.y1 = float(coords[end, 0]), float(coords[end, 1])
+        self.y_low = min(self.y0, self.y1)
+        self.sweep = sweep
+
+    def x_at(self, y):
+        if self.y1 == self.y0:
+            return min(self.x0, self.x1)
+        return self.x0 + (y - self.y0) * (self.x1 - self.x0) / (self.y1 - self.y0)
+
+    def __lt__(self, other):
+        y = self.sweep[0]
+        x_self, x_other = self.x_at(y), other.x_at(y)
+        if x_self == x_other:
+            # Edges which meet on the sweep line are ordered below it
+            y = max(self.y_low, other.y_low)
+            x_self, x_other = self.x_at(y), other.x_at(y)
+            if x_self == x_other:
+                return self.edge < other.edge
+        return x_self < x_other
+
+
+class _SweepPoint:
+    # A vertex on the sweep line, to search the status for the edges on its left
+    __slots__ = ["x"]
+
+    def __init__(self, x):
+        self.x = x
+
+    def __lt__(self, other):
+        return self.x < other.x_at(other.sweep[0])
+
+
+def _left_edge(coords, status, v):
+    # Find the edge of the sweep line status which lies directly left of vertex v
+    n = len(coords)
+    pos = status.bisect_right(_SweepPoint(float(coords[v, 0])))
+    # The edges which touch v are only in the status for polygons which are not simple
+    for i in range(pos - 1, -1, -1):
+        if status[i].edge != v and (status[i].edge + 1) % n != v:
+            return status[i].edge
+    for i in range(len(status) - 1, pos - 1, -1):
+        if status[i].edge != v and (status[i].edge + 1) % n != v:
+            return status[i].edge
+    return None
+
+
+def _monotone_diagonals(coords, order, rank):
+    # Sweep the polygon from top to bottom and add the diagonals which remove its split and merge vertices.
+    # The edge e_i goes from vertex i to vertex i + 1, and the status only holds edges with the interior on their right.
+    n = len(coords)
+    types = _vertex_types(coords, rank)
+    # The status is kept ordered along the sweep line, which is at the height of the current vertex
+    sweep = [0.0]
+    status = SortedList()
+    sweep_edges = {}
+    helper = {}
+    diagonals = []
+    for v in order:
+        v = int(v)
+        sweep[0] = float(coords[v, 1])
+        prev_edge = (v - 1) % n
+        vertex_type = types[v]
+        if vertex_type == _START:
+            _add_edge(status, sweep_edges, _SweepEdge(coords, v, sweep))
+            helper[v] = v
+        elif vertex_type == _END:
+            if _is_merge_helper(types, helper, prev_edge):
+                diagonals.append((v, helper[prev_edge]))
+            _remove_edge(status, sweep_edges, prev_edge)
+        elif vertex_type == _SPLIT:
+            left_edge = _left_edge(coords, status, v)
+            if left_edge is not None:
+                diagonals.append((v, helper[left_edge]))
+                helper[left_edge] = v
+            _add_edge(status, sweep_edges, _SweepEdge(coords, v, sweep))
+            helper[v] = v
+        elif vertex_type == _MERGE:
+            if _is_merge_helper(types, helper, prev_edge):
+                diagonals.append((v, helper[prev_edge]))
+            _remove_edge(status, sweep_edges, prev_edge)
+            left_edge = _left_edge(coords, status, v)
+            if left_edge is not None:
+                if types[helper[left_edge]] == _MERGE:
+                    diagonals.append((v, helper[left_edge]))
+                helper[left_edge] = v
+        elif rank[prev_edge] < rank[v]:
+            # Regular vertex on a chain going down, with the interior of the polygon on its right
+            if _is_merge_helper(types, helper, prev_edge):
+                diagonals.append((v, helper[prev_edge]))
+            _remove_edge(status, sweep_edges, prev_edge)
+            _add_edge(status, sweep_edges, _SweepEdge(coords, v, sweep))
+            helper[v] = v
+        else:
+            left_edge = _left_edge(coords, status, v)
+            if left_edge is not None:
+                if types[helper[left_edge]] == _MERGE:
+                    diagonals.append((v, helper[left_edge]))
+                helper[left_edge] = v
+    return diagonals
+
+
+def _is_merge_helper(types, helper, edge):
+    return edge in helper and types[helper[edge]] == _MERGE
+
+
+def _add_edge(status, sweep_edges, sweep_edge):
+    sweep_edges[sweep_edge.edge] = sweep_edge
+    status.add(sweep_edge)
+
+
+def _remove_edge(status, sweep_edges, edge):
+    # The edge is always in the status for simple polygons, but we don't want to fail on other inputs
+    sweep_edge = sweep_edges.pop(edge, None)
+    if sweep_edge is None:
+        return
+    try:
+        status.remove(sweep_edge)
+    except ValueError:
+        # The status can only be out of order along the sweep line for polygons which are not simple
+        del status[next(i for i, e in enumerate(status) if e is sweep_edge)]
+
+
+def _split_pieces(coords, diagonals):
+    # Walk the faces of the polygon cut along the diagonals, each face keeping the interior on its left
+    n = len(coords)
+    if len(diagonals) == 0:
+        return [list(range(n))]
+    neighbours = {}
+    for a, b in diagonals:
+        for u, w in [(a, b), (b, a)]:
+            neighbours.setdefault(u, [(u - 1) % n, (u + 1) % n]).append(w)
+    for u in neighbours:
+        angles = [np.arctan2(coords[w, 1] - coords[u, 1], coords[w, 0] - coords[u, 0]) for w in neighbours[u]]
+        neighbours[u] = [neighbours[u][i] for i in np.argsort(angles, kind="stable")]
+
+    def next_vertex(u, w):
+        if w not in neighbours:
+            return (w + 1) % n
+        # Turn to the first neighbour clockwise from the edge we arrived on
+        around = neighbours[w]
+        return around[around.index(u) - 1]
+
+    half_edges = [(i, (i + 1) % n) for i in range(n)]
+    for a, b in diagonals:
+        half_edges.extend([(a, b), (b, a)])
+    visited = set()
+    pieces = []
+    for half_edge in half_edges:
+        piece = []
+        u, w = half_edge
+        while (u, w) not in visited:
+            visited.add((u, w))
+            piece.append(u)
+            u, w = w, next_vertex(u, w)
+        if len(piece) >= 3:
+            pieces.append(piece)
+    return pieces
+
+
+def _triangulate_monotone(coords, piece, rank):
+    top = min(range(len(piece)), key=lambda i: rank[piece[i]])
+    bottom = max(range(len(piece)), key=lambda i: rank[piece[i]])
+    # Going counter-clockwise from the top vertex follows the left chain down to the bottom vertex
+    on_left_chain = {}
+    i = top
+    while i != bottom:
+        on_left_chain[piece[i]] = True
+        i = (i + 1) % len(piece)
+    while i != top:
+        on_left_chain[piece[i]] = False
+        i = (i + 1) % len(piece)
+
+    sorted_vertices = sorted(piece, key=lambda v: rank[v])
+    triangles = []
+    stack = sorted_vertices[:2]
+    for j in range(2, len(sorted_vertices) - 1):
+        u = sorted_vertices[j]
+        if on_left_chain[u] != on_left_chain[stack[-1]]:
+            while len(stack) > 1:
+                last = stack.pop()
+                triangles.append((u, last, stack[-1]))
+            stack = [sorted_vertices[j - 1], u]
+        else:
+            last = stack.pop()
+            while len(stack) > 0:
+                turn = _cross(coords, stack[-1], last, u)
+                if not (turn > 0 if on_left_chain[u] else turn < 0):
+                    break
+                triangles.append((u, last, stack[-1]))
+                last = stack.pop()
+            stack.extend([last, u])
+    u = sorted_vertices[-1]
+    while len(stack) > 1:
+        last = stack.pop()
+        triangles.append((u, last, stack[-1]))
+    return triangles
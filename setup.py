@@ -21,6 +21,7 @@ setup(
     author="ECMWF",
     author_email="James.Hawkes@ecmwf.int, Mathilde.Leuridan@ecmwf.int",
     packages=find_packages(),
+    package_data={"polytope.datacube.transformations": ["data/*.npy"]},
     zip_safe=False,
     include_package_data=True,
 )
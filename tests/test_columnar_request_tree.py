@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from polytope.datacube.backends.mock import MockDatacube
+from polytope.datacube.datacube_axis import FloatDatacubeAxis, IntDatacubeAxis
+from polytope.datacube.index_tree import ColumnarIndexTree, IndexTree
+from polytope.engine.hullslicer import HullSlicer
+from polytope.polytope import Polytope, Request
+from polytope.shapes import Box, Polygon, Select
+
+
+class TestColumnarIndexTree:
+    def setup_method(self, method):
+        self.axis1 = IntDatacubeAxis()
+        self.axis1.name = "child"
+        self.axis2 = IntDatacubeAxis()
+        self.axis2.name = "grandchild"
+
+    def test_create_child(self):
+        tree = ColumnarIndexTree()
+        child = tree.create_child(self.axis1, 2)
+        tree.create_child(self.axis1, 1)
+        assert tree.create_child(self.axis1, 2).flatten() == child.flatten()
+        child.create_child(self.axis2, 5)
+        child.create_child(self.axis2, 3)
+        tree.compact()
+        assert [str(c) for c in tree.root.children] == ["child=1", "child=2"]
+        assert [leaf.flatten()["grandchild"] for leaf in tree.leaves if "grandchild" in leaf.flatten()] == [3, 5]
+        assert list(tree.child_offsets[1]) == [0, 0, 2]
+
+    def test_create_child_within_tolerance(self):
+        axis = FloatDatacubeAxis()
+        axis.name = "latitude"
+        tree = ColumnarIndexTree()
+        tree.create_child(axis, 0.1).create_child(self.axis2, 1)
+        # The values are not identical, but they are equal within the tolerance of the axis
+        tree.create_child(axis, 0.1 + axis.tol).create_child(self.axis2, 2)
+        tree.create_child(axis, 0.1 - axis.tol).create_child(self.axis2, 1)
+        tree.create_child(axis, 0.2)
+        tree.compact()
+        assert [c.value for c in tree.root.children] == [0.1, 0.2]
+        assert [leaf.flatten() for leaf in tree.leaves] == [
+            {"latitude": 0.1, "grandchild": 1},
+            {"latitude": 0.1, "grandchild": 2},
+            {"latitude": 0.2},
+        ]
+
+    def test_remove_branch(self):
+        tree = ColumnarIndexTree()
+        child = tree.create_child(self.axis1, 1)
+        child.create_child(self.axis2, 1)
+        child.create_child(self.axis2, 2)
+        tree.create_child(self.axis1, 2).create_child(self.axis2, 1)
+        tree.compact()
+        leaves = tree.leaves
+        leaves[0].remove_branch()
+        assert len(tree.leaves) == 2
+        leaves[1].remove_branch()
+        # The child has no grandchildren left, so it is removed too
+        assert [leaf.flatten() for leaf in tree.leaves] == [{"child": 2, "grandchild": 1}]
+
+    def test_to_index_tree(self):
+        tree = ColumnarIndexTree()
+        tree.create_child(self.axis1, 2).create_child(self.axis2, 1)
+        tree.create_child(self.axis1, 1).create_child(self.axis2, 1)
+        tree.leaves[0].result = 10
+        index_tree = tree.to_index_tree()
+        assert isinstance(index_tree, IndexTree)
+        assert [(leaf.flatten(), leaf.result) for leaf in index_tree.leaves] == [
+            ({"child": 1, "grandchild": 1}, 10),
+            ({"child": 2, "grandchild": 1}, None),
+        ]
+
+    def test_to_arrays(self):
+        tree = ColumnarIndexTree()
+        grandchild = tree.create_child(self.axis1, 2).create_child(self.axis2, 1)
+        tree.create_child(self.axis1, 1)
+        grandchild.result = 5
+        # The leaf above the last level is exported like in an IndexTree
+        coords, values = tree.to_arrays()
+        assert [list(coords["child"]), list(coords["grandchild"])] == [[1, 2], [None, 1]]
+        assert np.isnan(values[0]) and values[1] == 5
+
+    def test_positions(self):
+        tree = ColumnarIndexTree()
+        tree.create_child(self.axis1, 2).position = 5
+        tree.create_child(self.axis1, 1)
+        tree.compact()
+        assert [child.position for child in tree.root.children] == [None, 5]
+        tree.root.children[0].position = 4
+        assert [child.position for child in tree.to_index_tree().children] == [4, 5]
+
+
+class TestColumnarExtraction:
+    def setup_method(self, method):
+        self.slicer = HullSlicer(columnar=True)
+
+    def test_mock_datacube(self):
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 10})
+        polytopes = Request(Polygon(["x", "y"], [[3, 3], [3, 9], [9, 3], [8, 8]]), Select("z", [1, 3, 5])).polytopes()
+        result = self.slicer.extract(datacube, polytopes)
+        assert isinstance(result, ColumnarIndexTree)
+        expected = HullSlicer().extract(datacube, polytopes)
+        assert [leaf.flatten() for leaf in result.leaves] == [leaf.flatten() for leaf in expected.leaves]
+        datacube.get(result)
+        datacube.get(expected)
+        assert [leaf.result for leaf in result.leaves] == [leaf.result for leaf in expected.leaves]
+        assert result.to_index_tree().to_dict() == expected.to_dict()
+
+    def test_xarray_datacube(self):
+        array = xr.DataArray(
+            np.random.randn(3, 6, 129),
+            dims=("date", "step", "level"),
+            coords={
+                "date": pd.date_range("2000-01-01", "2000-01-03", 3),
+                "step": [0, 3, 6, 9, 12, 15],
+                "level": range(1, 130),
+            },
+        )
+        request = Request(Box(["step", "level"], [3, 10], [6, 11]), Select("date", ["2000-01-01", "2000-01-03"]))
+        result = Polytope(datacube=array, engine=self.slicer).retrieve(request)
+        expected = Polytope(datacube=array, engine=HullSlicer()).retrieve(request)
+        assert len(result.leaves) == 2 * 2 * 2
+        assert [leaf.flatten() for leaf in result.leaves] == [leaf.flatten() for leaf in expected.leaves]
+        assert [leaf.result for leaf in result.leaves] == [leaf.result for leaf in expected.leaves]
+
+    def test_parallel(self):
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 10})
+        polytopes = Request(Box(["x", "y"], [3, 3], [6, 6]), Select("z", [1, 3, 5])).polytopes()
+        expected = HullSlicer().extract(datacube, polytopes)
+        for slicer in [
+            HullSlicer(parallel=True, max_workers=2, columnar=True),
+            HullSlicer(parallel=True, max_workers=2, split_axis="x", columnar=True),
+        ]:
+            result = slicer.extract(datacube, polytopes)
+            assert [leaf.flatten() for leaf in result.leaves] == [leaf.flatten() for leaf in expected.leaves]
+
+    def test_leaves_with_paths(self):
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 10})
+        polytopes = Request(Box(["x", "y"], [3, 3], [6, 6]), Select("z", [1, 3, 5])).polytopes()
+        result = self.slicer.extract(datacube, polytopes)
+        assert [path for _, path in result.leaves_with_paths()] == [leaf.flatten() for leaf in result.leaves]
+        # The paths carried down the tree during the extraction are not kept on the nodes, and the leaves never get one
+        for slicer in [HullSlicer(), HullSlicer(parallel=True, max_workers=2, split_axis="z")]:
+            assert not any(hasattr(leaf, "path") for leaf in slicer.extract(datacube, polytopes).leaves)
+
+    def test_to_xarray(self):
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 10})
+        polytopes = Request(Box(["x", "y"], [3, 3], [6, 6]), Select("z", [1, 3, 5])).polytopes()
+        result = self.slicer.extract(datacube, polytopes)
+        expected = HullSlicer().extract(datacube, polytopes)
+        datacube.get(result)
+        datacube.get(expected)
+        result.leaves[0].remove_branch()
+        expected.leaves[0].remove_branch()
+        assert result.to_xarray().identical(expected.to_xarray())
+        assert list(result.to_xarray().data_vars) == ["values"]
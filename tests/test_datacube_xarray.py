@@ -10,6 +10,9 @@ from polytope.datacube.datacube_axis import (
     IntDatacubeAxis,
     PandasTimestampDatacubeAxis,
 )
+from polytope.engine.hullslicer import HullSlicer
+from polytope.polytope import Polytope, Request
+from polytope.shapes import Box, Select
 from polytope.utility.exceptions import AxisNotFoundError, AxisOverdefinedError
 
 
@@ -130,3 +133,98 @@ class TestXarrayDatacube:
         idxs = datacube.get_indices(partial_request, label, -0.3, 10)
         assert idxs == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         assert isinstance(idxs[0], int)
+
+    def test_select_points(self):
+        array = xr.DataArray(
+            np.arange(24.0).reshape(2, 3, 4),
+            dims=("date", "level", "values"),
+            coords={"date": pd.date_range("2000-01-01", "2000-01-02", 2), "level": [1.0, 2.0, 3.0]},
+            name="t",
+        )
+        datacube = XArrayDatacube(array)
+        points = [
+            ({"date": pd.Timestamp("2000-01-02"), "level": 2.0}, {"values": 3}),
+            ({"date": pd.Timestamp("2000-01-01"), "level": 2.9}, {"values": 0}),
+        ]
+        values = datacube.select_points(points)
+        assert values == [datacube.select(path, unmapped_path).item() for path, unmapped_path in points]
+        assert values == [19.0, 8.0]
+        # Points which are not on the same dimensions are selected one by one, with the errors of a selection
+        with pytest.raises(ValueError):
+            datacube.select_points([points[0], ({"date": pd.Timestamp("2000-01-01")}, {"level": 1.0})])
+
+    def test_positions(self):
+        array = xr.DataArray(
+            np.random.randn(3, 6, 129),
+            dims=("date", "step", "level"),
+            coords={
+                "date": pd.date_range("2000-01-01", "2000-01-03", 3),
+                "step": [0, 3, 6, 9, 12, 15],
+                "level": range(1, 130),
+            },
+        )
+        datacube = XArrayDatacube(array)
+        axis = datacube.axes["level"]
+        path = DatacubePath(date=pd.Timestamp("2000-01-01"), step=3)
+        values, positions = datacube.get_indices_and_positions(DatacubePath(path), axis, 9.5, 12.5)
+        assert values == datacube.get_indices(DatacubePath(path), axis, 9.5, 12.5)
+        assert positions == [9, 10, 11]
+        request = Request(Box(["step", "level"], [3, 10], [6, 11]), Select("date", ["2000-01-01", "2000-01-03"]))
+        for engine in [HullSlicer(), HullSlicer(columnar=True), HullSlicer(parallel=True, max_workers=2)]:
+            result = Polytope(datacube=array, engine=engine).retrieve(request)
+            assert [leaf.position for leaf in result.leaves] == [9, 10] * 4
+            for leaf in result.leaves:
+                path = leaf.flatten()
+                assert leaf.result[1] == array.sel(path).item()
+
+    def test_index_cache(self):
+        array = xr.DataArray(
+            np.random.randn(3, 4),
+            dims=("step", "long"),
+            coords={"step": [0, 3, 6], "long": [0.0, 0.25, 0.5, 0.75]},
+        )
+        datacube = XArrayDatacube(array, axis_options={"long": {"transformation": {"cyclic": [0, 1.0]}}})
+        step_axis = datacube.axes["step"]
+        assert datacube.find_axis_indexes(DatacubePath(), step_axis) is array.indexes["step"]
+        long_axis = datacube.axes["long"]
+        assert datacube.fixed_indexes(long_axis) is None
+        # The cache is created by the first lookup, so datacubes do not need to create it
+        assert not hasattr(datacube, "_index_cache")
+        path = DatacubePath(step=3)
+        indexes = datacube.find_axis_indexes(path, long_axis)
+        assert list(indexes) == [0.0, 0.25, 0.5, 0.75]
+        assert len(datacube._index_cache) == 1
+        assert path == DatacubePath(step=3)
+        # The indexes of a path are only looked up once
+        assert datacube.find_axis_indexes(DatacubePath(step=3), long_axis) is indexes
+
+    def test_bulk_unmap(self, monkeypatch):
+        npoints = sum(2 * (4 * i + 16) for i in range(1, 9))
+        array = xr.DataArray(
+            np.random.randn(2, npoints),
+            dims=("step", "values"),
+            coords={"step": [0, 1], "values": np.arange(npoints)},
+        )
+        options = {
+            "values": {"transformation": {"mapper": {"type": "octahedral", "resolution": 8, "axes": ["lat", "lon"]}}}
+        }
+        request = Request(Box(["lat", "lon"], [-30, 10], [40, 100]), Select("step", [0, 1]))
+        API = Polytope(datacube=array, engine=HullSlicer(), axis_options=options)
+        datacube = API.datacube
+        grid_mapper = datacube._bulk_grid_mapper()
+        assert grid_mapper is not None
+        # The leaves are unmapped in several chunks, each with one call to the grid mapper
+        monkeypatch.setattr(datacube, "leaf_chunk_size", 50)
+        calls = []
+        unmap_many = grid_mapper.unmap_many
+        monkeypatch.setattr(grid_mapper, "unmap_many", lambda *args: calls.append(args) or unmap_many(*args))
+        result = API.retrieve(request)
+        assert len(result.leaves) > 100
+        assert len(calls) == -(-len(result.leaves) // 50)
+        monkeypatch.setattr(datacube, "_bulk_grid_mapper", lambda: None)
+        expected = API.retrieve(request)
+        assert [leaf.result for leaf in result.leaves] == [leaf.result for leaf in expected.leaves]
+        for leaf in result.leaves[:10]:
+            path = leaf.flatten()
+            grid_idx = grid_mapper.unmap(path["lat"], path["lon"])
+            assert leaf.result[1] == array.sel(step=path["step"], values=grid_idx).item()
@@ -1,6 +1,9 @@
+import scipy.spatial
+
 from polytope.datacube.backends.mock import MockDatacube
+from polytope.engine import hullslicer
 from polytope.engine.hullslicer import HullSlicer
-from polytope.shapes import Box, Polygon
+from polytope.shapes import Box, Polygon, Select, Union
 
 
 class TestEngineSlicer:
@@ -31,6 +34,18 @@ class TestEngineSlicer:
         result = self.slicer.extract(datacube, triangle)
         assert len(result.leaves) == 4 + 3 + 2 + 1
 
+    def test_polygon_convex_decomposition(self):
+        datacube = MockDatacube({"x": 100, "y": 100})
+        points = [[0, 0], [8, 0], [8, 4], [4, 4], [4, 8], [0, 8]]
+        triangles = Polygon(["x", "y"], points, decomposition="triangles").polytope()
+        pieces = Polygon(["x", "y"], points).polytope()
+        assert len(triangles) == 4
+        assert len(pieces) == 2
+        result = self.slicer.extract(datacube, pieces)
+        assert len(result.leaves) == 9 * 9 - 4 * 4
+        triangles_result = self.slicer.extract(datacube, triangles)
+        assert [leaf.flatten() for leaf in result.leaves] == [leaf.flatten() for leaf in triangles_result.leaves]
+
     def test_reusable(self):
         datacube = MockDatacube({"x": 100, "y": 100})
         polytopes = Polygon(["x", "y"], [[3, 3], [3, 6], [6, 3]]).polytope()
@@ -62,3 +77,47 @@ class TestEngineSlicer:
         result = self.slicer.extract(datacube, polytopes)
         datacube.get(result)
         result.pprint()
+
+    def test_4D_box_without_hull(self, monkeypatch):
+        def no_hull(*args, **kwargs):
+            raise AssertionError("Boxes should be sliced without computing convex hulls")
+
+        monkeypatch.setattr(scipy.spatial, "ConvexHull", no_hull)
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 100, "q": 100})
+        polytopes = Box(["x", "y", "z", "q"], lower_corner=[3, 3, 3, 3], upper_corner=[6, 6, 6, 6]).polytope()
+        assert polytopes[0].is_orthogonal
+        result = self.slicer.extract(datacube, polytopes)
+        assert len(result.leaves) == 4 * 4 * 4 * 4
+
+    def test_parallel_extract(self):
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 100})
+        boxes = [Box(["x", "y"], lower_corner=[i, i], upper_corner=[i + 3, i + 3]) for i in range(0, 20, 2)]
+        polytopes = Union(["x", "y"], *boxes).polytope() + Select("z", [1, 2, 3]).polytope()
+        result = self.slicer.extract(datacube, polytopes)
+        parallel_result = HullSlicer(parallel=True, max_workers=2).extract(datacube, polytopes)
+        assert [leaf.flatten() for leaf in parallel_result.leaves] == [leaf.flatten() for leaf in result.leaves]
+
+    def test_parallel_extract_split_axis(self):
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 100})
+        polytopes = Box(["x", "y", "z"], lower_corner=[3, 3, 3], upper_corner=[9, 6, 6]).polytope()
+        result = self.slicer.extract(datacube, polytopes)
+        parallel_result = HullSlicer(parallel=True, max_workers=2, split_axis="x").extract(datacube, polytopes)
+        assert len(parallel_result.leaves) == 7 * 4 * 4
+        assert [leaf.flatten() for leaf in parallel_result.leaves] == [leaf.flatten() for leaf in result.leaves]
+
+    def test_parallel_extract_split_axis_single_pool(self, monkeypatch):
+        pools = []
+
+        class CountingPool(hullslicer.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pools.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(hullslicer, "ProcessPoolExecutor", CountingPool)
+        datacube = MockDatacube({"x": 100, "y": 100, "z": 100})
+        boxes = [Box(["x", "y"], lower_corner=[i, i], upper_corner=[i + 3, i + 3]) for i in range(0, 20, 4)]
+        polytopes = Union(["x", "y"], *boxes).polytope() + Select("z", [1, 2, 3]).polytope()
+        result = self.slicer.extract(datacube, polytopes)
+        parallel_result = HullSlicer(parallel=True, max_workers=2, split_axis="x").extract(datacube, polytopes)
+        assert len(pools) == 1
+        assert [leaf.flatten() for leaf in parallel_result.leaves] == [leaf.flatten() for leaf in result.leaves]
@@ -1,5 +1,6 @@
 from itertools import product
 
+import numpy as np
 import pytest
 
 import polytope.engine.hullslicer
@@ -32,6 +33,74 @@ class TestHullSlicer:
             p = polytope.engine.hullslicer.slice(p, p._axes[-1], 0.5)
             print(p)
 
+    def test_slice_vertices_are_float_array(self):
+        p = ConvexPolytope(["a", "b"], [[0, 0], [4, 0], [0, 2]])
+        p1 = polytope.engine.hullslicer.slice(p, "b", 1)
+        assert isinstance(p1.points, np.ndarray)
+        assert p1.points.dtype == np.float64
+        assert p1.axes() == ["a"]
+        assert sorted(p1.points[:, 0].tolist()) == [0, 2]
+        assert polytope.engine.hullslicer.slice(p, "b", 3) is None
+
+    def test_slice_incident_vertex(self):
+        p = ConvexPolytope(["a", "b"], [[0, 0], [4, 0], [0, 2]])
+        p1 = polytope.engine.hullslicer.slice(p, "b", 0)
+        assert p1.extents("a") == (0, 4)
+
+    def test_slice_at_values(self):
+        p3 = self.construct_nd_cube(3)
+        values = [-2, -1, -0.5, 0, 0.25, 1, 3]
+        sliced = polytope.engine.hullslicer.slice_at_values(p3, "b", values)
+        assert len(sliced) == len(values)
+        for value, p2 in zip(values, sliced):
+            expected = polytope.engine.hullslicer.slice(p3, "b", value)
+            if expected is None:
+                assert p2 is None
+            else:
+                assert p2.axes() == ["a", "c"]
+                assert np.array_equal(np.unique(p2.points, axis=0), np.unique(expected.points, axis=0))
+
+    def test_slice_2D_to_interval(self):
+        p = ConvexPolytope(["a", "b"], [[0, 0], [4, 0], [4, 4], [2, 1], [0, 4]])
+        intervals = polytope.engine.hullslicer.slice_at_values(p, "a", [-1, 0, 1, 4, 5])
+        assert intervals[0] is None
+        assert intervals[4] is None
+        assert intervals[1].extents("b") == (0, 4)
+        assert intervals[2].extents("b") == (0, 4)
+        assert intervals[3].extents("b") == (0, 4)
+
+    def test_slice_2D_box(self):
+        p = ConvexPolytope(["a", "b"], [[1, 2], [1, 5], [3, 2], [3, 5]])
+        assert polytope.engine.hullslicer._is_axis_aligned_box(np.array(p.points, dtype=float))
+        assert polytope.engine.hullslicer.slice(p, "b", 3).extents("a") == (1, 3)
+        triangle = np.array([[1, 2], [1, 5], [3, 2]], dtype=float)
+        assert not polytope.engine.hullslicer._is_axis_aligned_box(triangle)
+
+    def test_polytope_hash(self):
+        p1 = ConvexPolytope(["a", "b"], np.array([[0, 0], [4, 0], [0, 2]], dtype=np.float64))
+        p2 = ConvexPolytope(["a", "b"], np.array([[4, 0], [0, 2], [0, 0], [0, 1e-14]], dtype=np.float64))
+        p3 = ConvexPolytope(["b", "a"], np.array([[0, 0], [4, 0], [0, 2]], dtype=np.float64))
+        assert p1 == p2
+        assert hash(p1) == hash(p2)
+        assert p1 != p3
+        assert len({p1, p2, p3}) == 2
+
+    def test_slice_cache(self):
+        datacube = MockDatacube({"a": 20, "b": 20, "c": 20})
+        triangle = ConvexPolytope(["a", "b"], [[0, 0], [4, 0], [0, 4]])
+        selects = [ConvexPolytope(["c"], [[i]]) for i in range(3)]
+        result = self.slicer.extract(datacube, [triangle] + selects)
+        assert len(result.leaves) == 3 * (5 + 4 + 3 + 2 + 1)
+        assert self.slicer._slice_cache == {}
+        # The slices of a polytope are kept under a single key, and the always empty slices of 1D polytopes are not kept
+        triangle = ConvexPolytope(["a", "b"], np.array([[0, 0], [4, 0], [0, 4]], dtype=np.float64))
+        intervals = self.slicer._slice_at_values(triangle, "a", [0.0, 1.0, 5.0])
+        assert self.slicer._slice_at_values(triangle, "a", [1.0, 2.0])[0] is intervals[1]
+        assert list(self.slicer._slice_cache) == [(triangle, "a")]
+        assert list(self.slicer._slice_cache[(triangle, "a")]) == [0.0, 1.0, 5.0, 2.0]
+        assert self.slicer._slice_at_values(intervals[0], "b", [0.0, 1.0]) == [None, None]
+        assert len(self.slicer._slice_cache) == 1
+
     def test_ND(self):
         with benchmark("4D"):
             p = self.construct_nd_cube(4)
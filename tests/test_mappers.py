@@ -1,4 +1,11 @@
-from polytope.datacube.transformations.datacube_mappers import OctahedralGridMapper
+import pytest
+
+from polytope.datacube.transformations.datacube_mappers import (
+    DatacubeMapper,
+    HealpixGridMapper,
+    OctahedralGridMapper,
+    write_latitude_tables,
+)
 
 
 class TestMapper:
@@ -103,3 +110,70 @@ class TestMapper:
         assert octahedral_mapper.unmap(89.94618771566562, 0) == 0
         assert octahedral_mapper.unmap(0.035149384215604956, 0) == 3299840 - 5136
         assert octahedral_mapper.unmap(-0.035149384215604956, 0) == 3299840
+
+    def test_unmap_many(self):
+        octahedral_mapper = OctahedralGridMapper("base", ["lat", "lon"], 8)
+        lats = []
+        lons = []
+        for lat in octahedral_mapper.first_axis_vals():
+            for lon in octahedral_mapper.second_axis_vals(lat):
+                lats.append(lat)
+                lons.append(lon)
+        # The points of the grid are numbered from north to south and west to east
+        assert list(octahedral_mapper.unmap_many(lats, lons)) == list(range(len(lats)))
+        assert [octahedral_mapper.unmap(lat, lon) for lat, lon in zip(lats, lons)] == list(range(len(lats)))
+        with pytest.raises(ValueError):
+            octahedral_mapper.unmap(lats[0] + 1e-5, 0)
+        with pytest.raises(ValueError):
+            octahedral_mapper.unmap_many(lats[:2], [0, 1])
+
+    def test_latitudes_cache(self, tmp_path):
+        mapped_axes = ["lat", "lon"]
+        base_axis = "base"
+        octahedral_mapper = OctahedralGridMapper(base_axis, mapped_axes, 1280)
+        # The computed latitudes are the same as the precomputed ones
+        assert octahedral_mapper.compute_gaussian_latitudes() == octahedral_mapper.get_precomputed_values_N1280()
+        octahedral_mapper = OctahedralGridMapper(base_axis, mapped_axes, 96)
+        lats = octahedral_mapper.first_axis_vals()
+        assert OctahedralGridMapper(base_axis, mapped_axes, 96).first_axis_vals() is lats
+        OctahedralGridMapper.latitudes_cache_dir = str(tmp_path)
+        try:
+            assert octahedral_mapper.load_or_compute_latitudes() == lats
+            assert (tmp_path / "octahedral_O96_latitudes.npy").exists()
+            assert octahedral_mapper.load_or_compute_latitudes() == lats
+        finally:
+            OctahedralGridMapper.latitudes_cache_dir = None
+
+    def test_latitude_tables(self, tmp_path):
+        for resolution in [320, 640, 1280, 2560]:
+            octahedral_mapper = OctahedralGridMapper("base", ["lat", "lon"], resolution)
+            lats = octahedral_mapper.load_or_compute_latitudes()
+            assert len(lats) == 2 * resolution
+            assert lats == octahedral_mapper.compute_gaussian_latitudes()
+        write_latitude_tables(str(tmp_path), [48])
+        assert (tmp_path / "octahedral_O48_latitudes.npy").exists()
+
+    def test_healpix_unmap(self):
+        healpix_mapper = HealpixGridMapper("base", ["lat", "lon"], 4)
+        lats = []
+        lons = []
+        for lat in healpix_mapper.first_axis_vals():
+            for lon in healpix_mapper.second_axis_vals(lat):
+                lats.append(lat)
+                lons.append(lon)
+        assert len(lats) == 12 * 4 * 4
+        # The points at longitude 360 are the first points of their latitude
+        assert lons[40:56] == [22.5 + i * 22.5 for i in range(16)]
+        assert [healpix_mapper.unmap(lat, lon) for lat, lon in zip(lats, lons)][40:56] == list(range(41, 56)) + [40]
+        assert sorted(healpix_mapper.unmap_many(lats, lons)) == list(range(len(lats)))
+        assert healpix_mapper.unmap(0, 11.25) == 4 + 8 + 12 + 4 * 16
+        assert healpix_mapper.unmap(lats[-1], lons[-1]) == len(lats) - 1
+        with pytest.raises(ValueError):
+            healpix_mapper.unmap(lats[0], 0)
+
+    def test_grid_mapper_created_once(self, monkeypatch):
+        mapper = DatacubeMapper("values", {"type": "octahedral", "resolution": 8, "axes": ["lat", "lon"]})
+        monkeypatch.setattr(DatacubeMapper, "generate_final_transformation", lambda self: pytest.fail())
+        assert mapper._mapped_axes() == ["lat", "lon"]
+        lat = mapper.first_axis_vals()[0]
+        assert mapper.unmap(lat, mapper.second_axis_vals(lat)[1]) == 1
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from polytope.engine.hullslicer import HullSlicer
+from polytope.engine.rasterizer import PolygonRasterizer
+from polytope.polytope import Polytope, Request
+from polytope.shapes import Box, Disk, Polygon, Select, Union
+
+
+class TestPolygonRasterizer:
+    def setup_method(self, method):
+        resolution = 32
+        npoints = sum(2 * (4 * i + 16) for i in range(1, resolution + 1))
+        self.array = xr.DataArray(
+            np.random.randn(2, npoints),
+            dims=("step", "values"),
+            coords={"step": [0, 1], "values": np.arange(npoints)},
+        )
+        self.options = {
+            "values": {
+                "transformation": {
+                    "mapper": {"type": "octahedral", "resolution": resolution, "axes": ["latitude", "longitude"]}
+                }
+            }
+        }
+
+    def leaves(self, engine, request, datacube=None, axis_options=None):
+        datacube = datacube if datacube is not None else self.array
+        axis_options = axis_options if axis_options is not None else self.options
+        API = Polytope(datacube=datacube, engine=engine, axis_options=axis_options)
+        result = API.slice(request.polytopes())
+        return [leaf.flatten() for leaf in result.leaves]
+
+    def assert_same_as_hull_slicer(self, request):
+        leaves = self.leaves(PolygonRasterizer(), request)
+        assert len(leaves) > 0
+        assert leaves == self.leaves(HullSlicer(), request)
+
+    def test_polygon(self):
+        points = [[0, 10], [15, 30], [5, 40], [20, 60], [-10, 50], [-20, 20]]
+        request = Request(Polygon(["latitude", "longitude"], points), Select("step", [0, 1]))
+        self.assert_same_as_hull_slicer(request)
+
+    def test_star_polygon(self):
+        angles = np.linspace(0, 2 * np.pi, 40, endpoint=False)
+        radii = np.where(np.arange(40) % 2 == 0, 20, 6)
+        points = [[10 + r * np.sin(a), 180 + r * np.cos(a)] for r, a in zip(radii, angles)]
+        request = Request(Polygon(["latitude", "longitude"], points), Select("step", [1]))
+        self.assert_same_as_hull_slicer(request)
+
+    def test_union(self):
+        request = Request(
+            Union(
+                ["latitude", "longitude"],
+                Box(["latitude", "longitude"], [0, 0], [10, 10]),
+                Disk(["latitude", "longitude"], [-30, 90], [10, 20]),
+            ),
+            Select("step", [0]),
+        )
+        self.assert_same_as_hull_slicer(request)
+
+    def test_parallel_split_axis(self):
+        points = [[0, 10], [15, 30], [5, 40], [20, 60], [-10, 50], [-20, 20]]
+        request = Request(Polygon(["latitude", "longitude"], points), Select("step", [0, 1]))
+        engine = PolygonRasterizer(parallel=True, max_workers=2, split_axis="latitude")
+        assert self.leaves(engine, request) == self.leaves(HullSlicer(), request)
+
+    def test_without_mapper(self):
+        # Without a grid mapper, the rasterizer slices all the axes like the hull slicer
+        array = xr.DataArray(
+            np.random.randn(3, 6, 129, 100),
+            dims=("date", "step", "level", "lat"),
+            coords={
+                "date": pd.date_range("2000-01-01", "2000-01-03", 3),
+                "step": [0, 3, 6, 9, 12, 15],
+                "level": range(1, 130),
+                "lat": np.around(np.arange(0.0, 10.0, 0.1), 15),
+            },
+        )
+        request = Request(
+            Polygon(["step", "level"], [[3, 1], [3, 10], [12, 5]]),
+            Select("date", ["2000-01-01"]),
+            Box(["lat"], [1], [2]),
+        )
+        leaves = self.leaves(PolygonRasterizer(), request, array, {})
+        assert len(leaves) > 0
+        assert leaves == self.leaves(HullSlicer(), request, array, {})
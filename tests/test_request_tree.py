@@ -1,6 +1,16 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
 from sortedcontainers import SortedList
 
-from polytope.datacube.datacube_axis import IntDatacubeAxis
+from polytope.datacube.datacube_axis import (
+    FloatDatacubeAxis,
+    IntDatacubeAxis,
+    PandasTimestampDatacubeAxis,
+    UnsliceableDatacubeAxis,
+)
 from polytope.datacube.index_tree import IndexTree
 
 
@@ -311,3 +321,181 @@ class TestIndexTree:
             "child1": {None: {"grandchild1": {None: {"greatgrandchild1": {None: 1}}}}},
             "child2": {None: None},
         }
+
+    def test_lazy_children(self):
+        axis1 = IntDatacubeAxis()
+        axis1.name = "child1"
+        root_node = IndexTree()
+        leaf1 = root_node.create_child(axis1, 1)
+        leaf2 = root_node.create_child(axis1, 2)
+        assert not hasattr(leaf1, "__dict__")
+        # The leaves share the same empty children list, which cannot be modified directly
+        assert leaf1.children is leaf2.children
+        assert len(leaf1.children) == 0
+        with pytest.raises(TypeError):
+            leaf1.children.add(IndexTree(axis1, 3))
+        grandchild = leaf1.create_child(axis1, 3)
+        assert leaf1.children == SortedList([grandchild])
+        assert len(leaf2.children) == 0
+        assert grandchild.parent == leaf1
+
+    def test_find_child_within_tolerance(self):
+        axis1 = FloatDatacubeAxis()
+        axis1.name = "child1"
+        root_node = IndexTree()
+        child = root_node.create_child(axis1, 1.0)
+        # Equal children may fall into neighbouring buckets of the child index, on either side
+        assert root_node.create_child(axis1, 1.0 - axis1.tol) is child
+        assert root_node.create_child(axis1, 1.0 + 2 * axis1.tol) is child
+        assert root_node.create_child(axis1, 1.0 + 3 * axis1.tol) is not child
+        assert len(root_node.children) == 2
+
+    def test_find_child_non_numeric(self):
+        axis1 = PandasTimestampDatacubeAxis()
+        axis1.name = "date"
+        root_node = IndexTree()
+        child = root_node.create_child(axis1, pd.Timestamp("2000-01-02"))
+        root_node.create_child(axis1, pd.Timestamp("2000-01-01"))
+        assert root_node.create_child(axis1, pd.Timestamp("2000-01-02")) is child
+        assert [c.value for c in root_node.children] == [pd.Timestamp("2000-01-01"), pd.Timestamp("2000-01-02")]
+        child.remove_branch()
+        assert root_node.find_child(IndexTree(axis1, pd.Timestamp("2000-01-02"))) is None
+
+    def test_leaves_with_paths(self):
+        axis1 = IntDatacubeAxis()
+        axis1.name = "child"
+        axis2 = IntDatacubeAxis()
+        axis2.name = "grandchild"
+        root_node = IndexTree()
+        for i in [3, 1, 2]:
+            child = root_node.create_child(axis1, i)
+            if i != 2:
+                child.create_child(axis2, 2 * i)
+                child.create_child(axis2, i)
+        leaves_with_paths = list(root_node.leaves_with_paths())
+        assert [leaf for leaf, _ in leaves_with_paths] == root_node.leaves
+        assert [path for _, path in leaves_with_paths] == [leaf.flatten() for leaf in root_node.leaves]
+        # The paths of the leaves of a subtree still start from the root
+        subtree = root_node.children[2]
+        assert [path for _, path in subtree.leaves_with_paths()] == [leaf.flatten() for leaf in subtree.leaves]
+
+    def test_iter_leaves(self):
+        axis = IntDatacubeAxis()
+        axis.name = "level"
+        root_node = IndexTree()
+        node = root_node
+        # The traversal is iterative, so deep trees do not hit the recursion limit
+        for i in range(5000):
+            node = node.create_child(axis, i)
+        assert list(root_node.iter_leaves()) == [node]
+        assert root_node.leaves == [node]
+
+    def test_leaves_of_unordered_children(self):
+        axis = IntDatacubeAxis()
+        axis.name = "level"
+        root_node = IndexTree()
+        for value in [1, 3, 5]:
+            root_node.create_child(axis, value)
+        assert [leaf.value for leaf in root_node.leaves] == [1, 3, 5]
+        # The children were added in order, so visiting them did not need to sort them
+        assert root_node._sorted_children is None
+        root_node.create_child(axis, 2)
+        root_node.create_child(axis, 4)
+        assert [leaf.value for leaf in root_node.leaves] == [1, 2, 3, 4, 5]
+        assert [leaf.value for leaf, _ in root_node.leaves_with_paths()] == [1, 2, 3, 4, 5]
+
+    def test_chunked_leaves_with_paths(self):
+        axis1 = IntDatacubeAxis()
+        axis1.name = "child"
+        axis2 = IntDatacubeAxis()
+        axis2.name = "grandchild"
+        root_node = IndexTree()
+        for i in range(3):
+            child = root_node.create_child(axis1, i)
+            for j in range(3):
+                child.create_child(axis2, j)
+        chunks = list(root_node.chunked_leaves_with_paths(4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+        assert [leaf for chunk in chunks for leaf, _ in chunk] == root_node.leaves
+        with pytest.raises(ValueError):
+            list(root_node.chunked_leaves_with_paths(0))
+
+    def test_npz_round_trip(self):
+        axis1 = PandasTimestampDatacubeAxis()
+        axis1.name = "date"
+        axis2 = FloatDatacubeAxis()
+        axis2.name = "latitude"
+        axis3 = UnsliceableDatacubeAxis()
+        axis3.name = "param"
+        root_node = IndexTree()
+        for date in pd.date_range("2000-01-01", "2000-01-03", 3):
+            child = root_node.create_child(axis1, date)
+            for latitude in [1.5, 0.5]:
+                for param in ["u", "v"]:
+                    child.create_child(axis2, latitude).create_child(axis3, param).result = latitude * 2
+        root_node.children[1].create_child(axis3, "t")
+        file = io.BytesIO()
+        root_node.to_npz(file)
+        file.seek(0)
+        loaded = IndexTree.from_npz(file)
+        assert [(leaf.flatten(), leaf.result) for leaf in loaded.leaves] == [
+            (leaf.flatten(), leaf.result) for leaf in root_node.leaves
+        ]
+        assert isinstance(loaded.leaves[0].axis, UnsliceableDatacubeAxis)
+        assert isinstance(loaded.leaves[0].parent.axis, FloatDatacubeAxis)
+        assert isinstance(loaded.children[0].axis, PandasTimestampDatacubeAxis)
+        assert isinstance(loaded.children[0].value, pd.Timestamp)
+
+    def test_npz_axes_and_key_value_results(self):
+        axis1 = IntDatacubeAxis()
+        axis1.name = "step"
+        axis2 = IntDatacubeAxis()
+        axis2.name = "level"
+        root_node = IndexTree()
+        for step in [0, 3]:
+            for level in [1, 2, 3]:
+                root_node.create_child(axis1, step).create_child(axis2, level).result = ("t", step + level * 0.5)
+        file = io.BytesIO()
+        root_node.to_npz(file, compressed=True)
+        file.seek(0)
+        with np.load(file) as data:
+            assert data["results"].dtype == float
+            assert data["result_names"].dtype.kind == "U"
+        file.seek(0)
+        loaded = IndexTree.from_npz(file, axes={"step": axis1})
+        assert loaded.children[0].axis is axis1
+        assert [leaf.result for leaf in loaded.leaves] == [leaf.result for leaf in root_node.leaves]
+
+    def test_npz_pickled_results(self):
+        axis1 = IntDatacubeAxis()
+        axis1.name = "step"
+        root_node = IndexTree()
+        for step in [0, 3]:
+            root_node.create_child(axis1, step).result = {"t": step}
+        file = io.BytesIO()
+        root_node.to_npz(file)
+        file.seek(0)
+        with pytest.raises(ValueError):
+            IndexTree.from_npz(file)
+        file.seek(0)
+        loaded = IndexTree.from_npz(file, allow_pickle=True)
+        assert [leaf.result for leaf in loaded.leaves] == [{"t": 0}, {"t": 3}]
+
+    def test_to_arrays(self):
+        axis1 = PandasTimestampDatacubeAxis()
+        axis1.name = "date"
+        axis2 = IntDatacubeAxis()
+        axis2.name = "level"
+        root_node = IndexTree()
+        for date in pd.date_range("2000-01-01", "2000-01-02", 2):
+            for level in [3, 1]:
+                root_node.create_child(axis1, date).create_child(axis2, level).result = ("t", level / 2)
+        coords, values = root_node.to_arrays()
+        assert list(coords) == ["date", "level"]
+        assert coords["date"].dtype == np.dtype("datetime64[ns]")
+        assert list(coords["level"]) == [1, 3, 1, 3]
+        assert list(values) == [0.5, 1.5, 0.5, 1.5]
+        dataset = root_node.to_xarray()
+        assert list(dataset.data_vars) == ["t"]
+        assert list(dataset["t"].values) == [0.5, 1.5, 0.5, 1.5]
+        assert list(dataset["date"].values) == list(coords["date"])
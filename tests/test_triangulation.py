@@ -0,0 +1,61 @@
+import math
+
+from polytope.utility.geometry import triangulate
+
+
+def polygon_area(points):
+    area = 0
+    for i in range(len(points)):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % len(points)]
+        area += x0 * y1 - x1 * y0
+    return abs(area) / 2
+
+
+class TestTriangulation:
+    def setup_method(self, method):
+        pass
+
+    def check_triangulation(self, points):
+        triangles = triangulate(points)
+        assert len(triangles) == len(points) - 2
+        for triangle in triangles:
+            for point in triangle:
+                assert list(point) in [list(p) for p in points]
+        assert math.isclose(sum(polygon_area(t) for t in triangles), polygon_area(points))
+
+    def test_convex_polygon(self):
+        self.check_triangulation([[0, 0], [2, 0], [3, 1], [2, 2], [0, 2]])
+
+    def test_concave_polygon(self):
+        self.check_triangulation([[1, 0], [3, 0], [2, 3], [3, 6], [1, 6]])
+        self.check_triangulation([[0, 0], [8, 0], [8, 4], [4, 4], [4, 8], [0, 8]])
+
+    def test_clockwise_polygon(self):
+        self.check_triangulation([[0, 8], [4, 8], [4, 4], [8, 4], [8, 0], [0, 0]])
+
+    def test_comb_polygon(self):
+        # Many vertices at the same heights, with both split and merge vertices
+        points = [[0, 0], [10, 0]]
+        for i in range(5, 0, -1):
+            points += [[2 * i, 5], [2 * i - 1, 5], [2 * i - 1, 1], [2 * i - 2, 1]]
+        points[-1] = [0, 5]
+        self.check_triangulation(points)
+        self.check_triangulation([[-x, -y] for x, y in points])
+        self.check_triangulation([[y, x] for x, y in points])
+
+    def test_long_comb_polygon(self):
+        # The edges of the comb teeth are all crossed by the sweep line at the same time
+        points = [[0, 0], [200, 0]]
+        for i in range(100, 0, -1):
+            points += [[2 * i, 5 + i % 3], [2 * i - 1, 5 + i % 3], [2 * i - 1, 1], [2 * i - 2, 1]]
+        points[-1] = [0, 5]
+        self.check_triangulation(points)
+        self.check_triangulation([[-x, -y] for x, y in points])
+
+    def test_closed_polygon(self):
+        assert len(triangulate([[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]])) == 2
+
+    def test_degenerate_polygon(self):
+        assert triangulate([[0, 0], [1, 1]]) == []
+        assert triangulate([[0, 0], [1, 1], [2, 2]]) == []